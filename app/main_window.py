@@ -7,7 +7,7 @@ between backend engines and frontend GUI components.
 
 import os
 import tkinter as tk
-from typing import Optional
+from typing import Optional, Sequence
 
 from backend.digimon_importer import DigimonImporter
 # Backend imports
@@ -49,6 +49,10 @@ except ImportError:
     COLORS_AVAILABLE = False
 
 
+# Interval for picking up VPet render updates (half the fastest animation sub-step)
+VPET_RENDER_POLL_MS = 50
+
+
 class MainWindow:
     """
     Main application window controller.
@@ -79,6 +83,7 @@ class MainWindow:
         self.pomodoro_gui: Optional[PomodoroGUI] = None
         self.vpet_gui: Optional[VPetGUI] = None
         self.events_window: Optional[tk.Toplevel] = None
+        self._vpet_render_job: Optional[str] = None
 
         # Setup everything
         self.setup_window()
@@ -133,6 +138,20 @@ class MainWindow:
         # Set up transparency
         self._setup_transparency()
 
+        # Pause VPet animation work while the window is minimized
+        self.root.bind("<Map>", self._on_window_mapped)
+        self.root.bind("<Unmap>", self._on_window_unmapped)
+
+    def _on_window_mapped(self, event: tk.Event) -> None:
+        """Resume VPet animation when the main window is shown again."""
+        if event.widget is self.root:
+            self.vpet_engine.set_visible(True)
+
+    def _on_window_unmapped(self, event: tk.Event) -> None:
+        """Idle VPet animation while the main window is hidden."""
+        if event.widget is self.root:
+            self.vpet_engine.set_visible(False)
+
     def _setup_transparency(self) -> None:
         """Set up window transparency."""
         try:
@@ -204,8 +223,9 @@ class MainWindow:
 
     def start_engines(self) -> None:
         """Start the backend engines."""
-        # Start VPet animation
+        # Start VPet animation and the loop rendering its updates
         self.vpet_engine.start_animation()
+        self._poll_vpet_render()
 
         # Update initial display
         self._update_all_displays()
@@ -259,8 +279,15 @@ class MainWindow:
 
         logger.info(f"Session completed: {completed_mode}")
 
+    def _poll_vpet_render(self) -> None:
+        """Render the latest VPet state and schedule the next poll."""
+        self.vpet_engine.dispatch_render_update()
+        self._vpet_render_job = self.root.after(
+            VPET_RENDER_POLL_MS, self._poll_vpet_render
+        )
+
     def _on_vpet_position_update(
-        self, x: int, y: int, frame: int, sprite_key: str, projectiles: list
+        self, x: int, y: int, frame: int, sprite_key: str, projectiles: Sequence
     ) -> None:
         """
         Handle VPet position update.
@@ -270,55 +297,49 @@ class MainWindow:
             y: Y position
             frame: Animation frame
             sprite_key: Key for the sprite to display
-            projectiles: List of active projectile dictionaries
+            projectiles: List of active projectile (x, y, sprite_key) tuples
         """
         if self.vpet_gui:
             # Get sprite data from VPet engine
             sprite_data = self.vpet_engine.get_sprite(sprite_key)
             current_mode = self.vpet_engine.current_mode
 
-            projectile_sprites = []
-            for proj in projectiles:
-                psprite_data = self.vpet_engine.get_projectile_sprite(
-                    proj.get("sprite_key", "")
-                )
-                projectile_sprites.append(
-                    (
-                        proj.get("x", 0),
-                        proj.get("y", 0),
-                        psprite_data,
-                        proj.get("sprite_key", ""),
-                    )
-                )
+            get_projectile_sprite = self.vpet_engine.get_projectile_sprite
+            projectile_sprites = [
+                (px, py, get_projectile_sprite(psprite_key), psprite_key)
+                for px, py, psprite_key in projectiles
+            ]
+
+            # Set direction hint for fallback rendering before drawing
+            direction = self.vpet_engine.direction
+            self.vpet_gui.set_direction_hint(direction)
 
             # Update VPet display
             self.vpet_gui.update_vpet_display(
                 x, y, sprite_data, sprite_key, current_mode, projectile_sprites
             )
 
-            # Set direction hint for fallback rendering
-            direction = self.vpet_engine.direction
-            self.vpet_gui.set_direction_hint(direction)
-
     def _on_start_pause_clicked(self) -> None:
         """Handle start/pause button click from Pomodoro GUI."""
-        engine_state = self.pomodoro_engine.get_state()
+        # Only the two flags are needed, so skip building the full state dict
+        is_running = self.pomodoro_engine.is_running
+        is_paused = self.pomodoro_engine.is_paused
 
-        if not engine_state["is_running"] and not engine_state["is_paused"]:
+        if not is_running and not is_paused:
             # Start timer
             success = self.pomodoro_engine.start()
             if success and self.pomodoro_gui:
                 self.pomodoro_gui.update_button_state(True, False)
             # Inform VPet engine timer is running
             self.vpet_engine.set_timer_running(True)
-        elif engine_state["is_running"]:
+        elif is_running:
             # Pause timer
             success = self.pomodoro_engine.pause()
             if success and self.pomodoro_gui:
                 self.pomodoro_gui.update_button_state(False, True)
             # Inform VPet engine timer is paused
             self.vpet_engine.set_timer_running(False)
-        elif engine_state["is_paused"]:
+        elif is_paused:
             # Resume timer
             success = self.pomodoro_engine.resume()
             if success and self.pomodoro_gui:
@@ -408,6 +429,7 @@ class MainWindow:
             # Clear GUI sprite cache to ensure new Digimon is displayed
             if self.vpet_gui:
                 self.vpet_gui.clear_sprite_cache()
+                self._preload_vpet_sprites()
 
             # Update Pomodoro engine with new vpet name
             self.pomodoro_engine.set_vpet_name(selected_digimon)
@@ -424,6 +446,7 @@ class MainWindow:
             current = self.vpet_gui.get_scale_factor()
             new_scale = current + 0.25
             self.vpet_gui.set_scale_factor(new_scale)
+            self._preload_vpet_sprites()
             print(f"[DEBUG] Increased VPet scale: {current:.2f} -> {new_scale:.2f}")
 
     def _on_decrease_vpet_size(self) -> None:
@@ -432,8 +455,15 @@ class MainWindow:
             current = self.vpet_gui.get_scale_factor()
             new_scale = current - 0.25
             self.vpet_gui.set_scale_factor(new_scale)
+            self._preload_vpet_sprites()
             print(f"[DEBUG] Decreased VPet scale: {current:.2f} -> {new_scale:.2f}")
 
+    def _preload_vpet_sprites(self) -> None:
+        """Prepare display images for all loaded VPet and projectile sprites."""
+        if self.vpet_gui:
+            self.vpet_gui.preload_sprites(self.vpet_engine.sprites)
+            self.vpet_gui.preload_sprites(self.vpet_engine.projectile_sprites)
+
     def _update_digimon_list(self) -> None:
         """Update the Digimon selector dropdown with available Digimon."""
         available_digimon = self.digimon_importer.get_available_digimon()
@@ -514,10 +544,11 @@ class MainWindow:
                 engine_state["is_running"], engine_state["is_paused"]
             )
 
-        # Update VPet canvas size
+        # Update VPet canvas size and prepare its sprites
         if self.vpet_gui:
             canvas_width, canvas_height = self.vpet_gui.get_canvas_size()
             self.vpet_engine.set_canvas_size(canvas_width, canvas_height)
+            self._preload_vpet_sprites()
 
     def _send_notifications(self, completed_mode: str) -> None:
         """
@@ -584,7 +615,13 @@ class MainWindow:
         if self.pomodoro_engine and hasattr(self.pomodoro_engine, "time_logger"):
             self.pomodoro_engine.time_logger.cleanup_on_exit()
 
-        # Stop VPet animation
+        # Stop VPet animation and its render loop
         self.vpet_engine.stop_animation()
+        if self._vpet_render_job is not None:
+            try:
+                self.root.after_cancel(self._vpet_render_job)
+            except tk.TclError:
+                pass  # Root window already destroyed
+            self._vpet_render_job = None
 
         logger.info("Application cleanup completed")
@@ -14,6 +14,7 @@ implementations do not need to worry about orientation.
 
 from __future__ import annotations
 
+import math
 import random
 from dataclasses import dataclass, field
 from typing import Callable, Dict, Iterable, Optional, Sequence
@@ -26,6 +27,21 @@ except ImportError:  # pragma: no cover - fallback to stdlib logging
     logger = logging.getLogger(__name__)
 
 
+def sample_trigger_ticks(probability: float, rng: random.Random) -> Optional[int]:
+    """Sample after how many ticks a per-tick chance first succeeds.
+
+    Rolling ``probability`` once per tick until it succeeds takes a
+    geometrically distributed number of ticks, so a single sample
+    replaces all the per-tick rolls.  Returns ``None`` if the chance is
+    zero and the roll never succeeds.
+    """
+    if probability <= 0:
+        return None
+    if probability >= 1:
+        return 1
+    return int(math.log(1.0 - rng.random()) / math.log(1.0 - probability)) + 1
+
+
 @dataclass
 class PetEvent:
     """Generic description of an animation event.
@@ -41,7 +57,9 @@ class PetEvent:
         in which this event is allowed to trigger.
     probability:
         Per frame probability for the event to trigger while the pet is
-        in a valid mode.
+        in a valid mode.  The engine samples the next trigger tick from
+        it up front; subclasses restrict *when* an event may start by
+        overriding :meth:`is_eligible` or passing ``condition``.
     frame_delay:
         Number of animation cycles to wait before switching to the next
         frame in ``frames``.
@@ -82,13 +100,21 @@ class PetEvent:
             f"Event '{self.name}' triggered for {self.cycles} cycles ({total_frames} frames)"
         )
 
-    def should_trigger(self, engine: "VPetEngine") -> bool:
-        """Return ``True`` if the event wants to start."""
+    def is_eligible(self, engine: "VPetEngine") -> bool:
+        """Return ``True`` if the event may trigger in the engine's state."""
         if engine.current_mode not in self.modes:
             return False
         if self.condition and not self.condition(engine):
             return False
-        return random.random() < self.probability
+        return True
+
+    def ticks_until_trigger(self, rng: random.Random) -> Optional[int]:
+        """Sample after how many animation ticks the event triggers next.
+
+        Returns ``None`` if the event never triggers on its own.  ``rng``
+        is the engine's generator.
+        """
+        return sample_trigger_ticks(self.probability, rng)
 
     def update(self, engine: "VPetEngine") -> tuple[int, bool]:
         """Advance the event by one animation tick.
@@ -98,17 +124,26 @@ class PetEvent:
         event has completed and should be cleaned up.
         """
 
-        frame = self.frames[self._current_frame_index]
-        self._frame_delay_counter += 1
-        if self._frame_delay_counter >= self.frame_delay:
-            self._frame_delay_counter = 0
-            self._current_frame_index += 1
-            if self._current_frame_index >= len(self.frames):
-                self._current_frame_index = 0
-                self._cycles_remaining -= 1
-                if self._cycles_remaining <= 0:
-                    self.active = False
-                    return frame, True
+        frames = self.frames
+        index = self._current_frame_index
+        frame = frames[index]
+
+        delay_counter = self._frame_delay_counter + 1
+        if delay_counter < self.frame_delay:
+            self._frame_delay_counter = delay_counter
+            return frame, False
+
+        self._frame_delay_counter = 0
+        index += 1
+        if index < len(frames):
+            self._current_frame_index = index
+            return frame, False
+
+        self._current_frame_index = 0
+        self._cycles_remaining -= 1
+        if self._cycles_remaining <= 0:
+            self.active = False
+            return frame, True
         return frame, False
 
     def complete(self, engine: "VPetEngine") -> Optional[str]:
@@ -144,7 +179,7 @@ class HappyEvent(PetEvent):
 
     def start(self, engine: "VPetEngine") -> None:  # type: ignore[override]
         # Random number of cycles between 1 and 3 for variety
-        self.cycles = random.randint(1, 3)
+        self.cycles = engine.rng.randint(1, 3)
         super().start(engine)
 
 
@@ -165,7 +200,7 @@ class AttackTrainingEvent(PetEvent):
 
     def start(self, engine: "VPetEngine") -> None:  # type: ignore[override]
         # Attack lasts for a random number of frame pairs
-        self.cycles = random.randint(5, 10)
+        self.cycles = engine.rng.randint(5, 10)
         super().start(engine)
 
     def update(self, engine: "VPetEngine") -> tuple[int, bool]:  # type: ignore[override]
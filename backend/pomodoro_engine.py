@@ -8,6 +8,7 @@ separated from GUI concerns for better maintainability.
 import threading
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Callable, Optional
 
 # Enhanced imports with fallbacks
@@ -28,6 +29,13 @@ except ImportError:
 from .time_logger import TimeLogger
 
 
+@lru_cache(maxsize=4096)
+def _format_mm_ss(seconds: int) -> str:
+    """Format seconds as MM:SS; the timer only ever shows a few thousand values."""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
 class PomodoroEngine:
     """
     Core Pomodoro timer engine handling timer logic and state management.
@@ -287,8 +295,6 @@ class PomodoroEngine:
         """
         if seconds is None:
             seconds = self.time_remaining
-            
-        minutes = seconds // 60
-        seconds = seconds % 60
-        return f"{minutes:02d}:{seconds:02d}"
+
+        return _format_mm_ss(seconds)
 
@@ -18,6 +18,13 @@ except ImportError:
 
     logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class TimeLogger:
     """
@@ -62,8 +69,11 @@ class TimeLogger:
             )
             return False
 
+        start_time = datetime.now()
         self.current_session = {
-            "start_time": datetime.now().isoformat(),
+            "start_time": start_time.isoformat(),
+            # Epoch seconds let readers bucket sessions without parsing ISO text
+            "start_epoch": int(start_time.timestamp()),
             "end_time": None,
             "duration_minutes": None,
             "session_type": "work",
@@ -192,48 +202,52 @@ class TimeLogger:
         """
         return self.sessions.copy()
 
-    def get_stats_by_vpet(self) -> Dict:
+    @staticmethod
+    def _aggregate_by_vpet(sessions: List[Dict]) -> Dict:
         """
-        Get statistics grouped by vpet name.
+        Aggregate session statistics per vpet name in a single pass.
+
+        Args:
+            sessions: Sessions to aggregate
 
         Returns:
             Dict: Statistics for each vpet name
         """
-        vpet_stats = {}
-        
-        for session in self.sessions:
+        # Accumulate into flat lists: [total_minutes, session_count, completed]
+        totals: Dict[str, list] = {}
+        for session in sessions:
             vpet_name = session.get("vpet_name", "Unknown")
-            
-            if vpet_name not in vpet_stats:
-                vpet_stats[vpet_name] = {
-                    "total_minutes": 0,
-                    "session_count": 0,
-                    "completed_sessions": 0,
-                    "interrupted_sessions": 0
-                }
-            
-            stats = vpet_stats[vpet_name]
-            stats["total_minutes"] += session.get("duration_minutes", 0)
-            stats["session_count"] += 1
-            
+            acc = totals.get(vpet_name)
+            if acc is None:
+                acc = totals[vpet_name] = [0, 0, 0]
+            acc[0] += session.get("duration_minutes", 0)
+            acc[1] += 1
             if session.get("completed", False):
-                stats["completed_sessions"] += 1
-            else:
-                stats["interrupted_sessions"] += 1
-        
-        # Round total minutes and add derived stats
-        for vpet_name, stats in vpet_stats.items():
-            stats["total_minutes"] = round(stats["total_minutes"], 2)
-            stats["total_hours"] = round(stats["total_minutes"] / 60, 2)
-            if stats["session_count"] > 0:
-                stats["success_rate"] = round(
-                    (stats["completed_sessions"] / stats["session_count"]) * 100, 1
-                )
-            else:
-                stats["success_rate"] = 0.0
-        
+                acc[2] += 1
+
+        vpet_stats = {}
+        for vpet_name, (total_minutes, session_count, completed) in totals.items():
+            total_minutes = round(total_minutes, 2)
+            vpet_stats[vpet_name] = {
+                "total_minutes": total_minutes,
+                "session_count": session_count,
+                "completed_sessions": completed,
+                "interrupted_sessions": session_count - completed,
+                "total_hours": round(total_minutes / 60, 2),
+                "success_rate": round((completed / session_count) * 100, 1),
+            }
+
         return vpet_stats
 
+    def get_stats_by_vpet(self) -> Dict:
+        """
+        Get statistics grouped by vpet name.
+
+        Returns:
+            Dict: Statistics for each vpet name
+        """
+        return self._aggregate_by_vpet(self.sessions)
+
     def get_today_stats_by_vpet(self) -> Dict:
         """
         Get today's statistics grouped by vpet name.
@@ -247,41 +261,12 @@ class TimeLogger:
             for session in self.sessions
             if datetime.fromisoformat(session["start_time"]).date() == today
         ]
-        
-        vpet_stats = {}
-        
-        for session in today_sessions:
-            vpet_name = session.get("vpet_name", "Unknown")
-            
-            if vpet_name not in vpet_stats:
-                vpet_stats[vpet_name] = {
-                    "total_minutes": 0,
-                    "session_count": 0,
-                    "completed_sessions": 0,
-                    "interrupted_sessions": 0
-                }
-            
-            stats = vpet_stats[vpet_name]
-            stats["total_minutes"] += session.get("duration_minutes", 0)
-            stats["session_count"] += 1
-            
-            if session.get("completed", False):
-                stats["completed_sessions"] += 1
-            else:
-                stats["interrupted_sessions"] += 1
-        
-        # Round total minutes and add derived stats
-        for vpet_name, stats in vpet_stats.items():
-            stats["date"] = today.isoformat()
-            stats["total_minutes"] = round(stats["total_minutes"], 2)
-            stats["total_hours"] = round(stats["total_minutes"] / 60, 2)
-            if stats["session_count"] > 0:
-                stats["success_rate"] = round(
-                    (stats["completed_sessions"] / stats["session_count"]) * 100, 1
-                )
-            else:
-                stats["success_rate"] = 0.0
-        
+
+        vpet_stats = self._aggregate_by_vpet(today_sessions)
+        today_iso = today.isoformat()
+        for stats in vpet_stats.values():
+            stats["date"] = today_iso
+
         return vpet_stats
 
     def cleanup_on_exit(self) -> None:
@@ -302,15 +287,19 @@ class TimeLogger:
             return
 
         try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.sessions = data.get("sessions", [])
+            if ORJSON_AVAILABLE:
+                with open(self.log_file, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.log_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            self.sessions = data.get("sessions", [])
 
             logger.info(
                 f"Loaded {len(self.sessions)} existing sessions from {self.log_file}"
             )
 
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
             logger.error(f"Error loading session data: {e}")
             self.sessions = []
 
@@ -322,8 +311,17 @@ class TimeLogger:
                 "last_updated": datetime.now().isoformat(),
             }
 
-            with open(self.log_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # The whole log is rewritten on every save, so serialize it with
+            # orjson when available; the file layout stays the same.
+            # Serialize before opening, so a failure cannot truncate the log.
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode(
+                    "utf-8"
+                )
+            with open(self.log_file, "wb") as f:
+                f.write(payload)
 
             logger.debug(f"Saved {len(self.sessions)} sessions to {self.log_file}")
 
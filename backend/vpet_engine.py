@@ -5,14 +5,17 @@ This module contains the core logic for the virtual pet,
 including sprite management, animation state, and behavior logic.
 """
 
+import heapq
+import os
 import random
 import threading
-import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 from .pet_events import (AttackTrainingEvent, HappyEvent, PetEvent,
-                         collect_event_frames)
+                         collect_event_frames, sample_trigger_ticks)
 
 # Enhanced imports with fallbacks
 try:
@@ -23,7 +26,7 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image
 
     PIL_AVAILABLE = True
 except ImportError:
@@ -31,6 +34,36 @@ except ImportError:
     logger.info("PIL not available - using basic sprite loading")
 
 
+# Seconds between visibility checks while the VPet display is hidden
+HIDDEN_POLL_INTERVAL = 0.25
+
+# (move_speed, animation_delay) per mode: faster movement during work time
+# (pet is training/active), slower during breaks (pet is relaxing)
+_MODE_ANIMATION_PARAMETERS: Dict[str, Tuple[int, float]] = {"work": (3, 0.3)}
+_DEFAULT_ANIMATION_PARAMETERS: Tuple[int, float] = (1, 0.7)
+
+
+class Projectile:
+    """A projectile in flight, e.g. a fireball launched by an attack event."""
+
+    __slots__ = ("x", "y", "direction", "sprite_key")
+
+    def __init__(self, x: float, y: int, direction: int, sprite_key: str):
+        """
+        Initialize a projectile.
+
+        Args:
+            x: Horizontal position on the canvas
+            y: Vertical position on the canvas
+            direction: Travel direction (1 for right, -1 for left)
+            sprite_key: Key of the projectile sprite to display
+        """
+        self.x = x
+        self.y = y
+        self.direction = direction
+        self.sprite_key = sprite_key
+
+
 class VPetEngine:
     """
     Core VPet engine handling sprite management, animation logic, and pet behavior.
@@ -46,15 +79,21 @@ class VPetEngine:
         self,
         sprite_directory: str = "sprites/Agumon_penc",
         root_window: Optional[object] = None,
+        rng: Optional[random.Random] = None,
     ):
         """
         Initialize the VPet engine.
 
         Args:
             sprite_directory: Path to the directory containing sprite files
-            root_window: Reference to the main tkinter window for thread-safe updates
+            root_window: Reference to the main tkinter window. Unused by the
+                engine; the GUI pulls render updates via dispatch_render_update()
+            rng: Random generator for walking and event timing. Pass a seeded
+                ``random.Random`` for reproducible behavior.
         """
         self.sprite_directory = sprite_directory
+        # Single source of randomness for the engine and its events
+        self.rng = rng if rng is not None else random.Random()
         self.sprites: Dict[str, any] = {}
         self.projectile_sprites: Dict[str, any] = {}
         self.root_window = root_window
@@ -67,8 +106,9 @@ class VPetEngine:
         self.sprite_width = 48
         self.sprite_height = 48
         self.margin = 12
+        self._recompute_bounds()
         # Projectile state
-        self.projectiles: list[dict] = []
+        self.projectiles: List[Projectile] = []
         self.projectile_speed = 12
         self.projectile_width = 20
 
@@ -80,7 +120,13 @@ class VPetEngine:
         # Registered animation events
         self.events: Dict[str, PetEvent] = {}
         self.active_event: Optional[PetEvent] = None
-        self.event_queue: list[str] = []
+        self.event_queue: Deque[str] = deque()
+
+        # Walking ticks elapsed and a heap of (due tick, registration order,
+        # event name) telling when each event triggers next
+        self._walk_tick = 0
+        self._event_order: Dict[str, int] = {}
+        self._event_schedule: List[Tuple[int, int, str]] = []
 
         # Register default events (attack training and happy celebration)
         self._register_default_events()
@@ -93,45 +139,113 @@ class VPetEngine:
         self.direction_change_probability = (
             0.07  # Chance per frame to change direction (7%)
         )
+        # Eligible ticks left until the next random turn (None = not sampled)
+        self._ticks_until_turn: Optional[int] = None
 
         # Behavior state
         self.current_mode = "work"  # "work" or "break"
         self.is_active = False
+        # Whether the pet is on screen; the animation idles while hidden
+        self.visible = True
 
         # Animation thread
         self.animation_thread: Optional[threading.Thread] = None
         self.animation_running = False
+        # Set to wake the animation thread immediately when stopping
+        self._stop_event = threading.Event()
 
         # Pomodoro timer running state (must be set False by default)
         self.is_timer_running = False
 
         # Callbacks
         self.on_position_update_callback: Optional[
-            Callable[[int, int, int, str, list], None]
+            Callable[[int, int, int, str, Sequence], None]
         ] = None
 
+        # Latest render state published by the animation thread. The GUI
+        # thread picks it up via dispatch_render_update(); older states that
+        # were never rendered are simply overwritten.
+        self._render_mailbox: Deque[tuple] = deque(maxlen=1)
+
         # Load sprites
         self.load_sprites()
 
     def set_callbacks(
         self,
-        on_position_update: Optional[Callable[[int, int, int, str, list], None]] = None,
+        on_position_update: Optional[Callable[[int, int, int, str, Sequence], None]] = None,
     ):
         """
         Set callback functions for VPet events.
 
         Args:
             on_position_update: Called when pet position updates
-                (x, y, frame, direction_key, projectiles)
+                (x, y, frame, direction_key, projectiles) where projectiles
+                is a list of (x, y, sprite_key) tuples
         """
         self.on_position_update_callback = on_position_update
 
+    def dispatch_render_update(self) -> bool:
+        """
+        Deliver the latest published pet state to the position callback.
+
+        Must be called from the GUI thread, typically from a recurring
+        ``root.after`` loop.
+
+        Returns:
+            bool: True if a new state was delivered, False otherwise
+        """
+        try:
+            state = self._render_mailbox.popleft()
+        except IndexError:
+            return False
+        callback = self.on_position_update_callback
+        if callback is not None:
+            callback(*state)
+        return True
+
     # ------------------------------------------------------------------
     # Event registration helpers
 
     def register_event(self, event: PetEvent) -> None:
         """Register a new animation event with the engine."""
-        self.events[event.name] = event
+        name = event.name
+        if name in self._event_order:
+            # Drop the schedule entry of the event being replaced
+            self._event_schedule = [
+                entry for entry in self._event_schedule if entry[2] != name
+            ]
+            heapq.heapify(self._event_schedule)
+        else:
+            self._event_order[name] = len(self._event_order)
+        self.events[name] = event
+        self._schedule_event(name)
+
+    def _schedule_event(self, name: str) -> None:
+        """Schedule the next time the named event triggers on its own."""
+        delay = self.events[name].ticks_until_trigger(self.rng)
+        if delay is not None:
+            heapq.heappush(
+                self._event_schedule,
+                (self._walk_tick + delay, self._event_order[name], name),
+            )
+
+    def _trigger_due_event(self) -> None:
+        """Start the first due event that may run in the current state.
+
+        Due events are rescheduled whether or not they start, so only one
+        event starts per tick, as with rolling each event every tick.
+        """
+        schedule = self._event_schedule
+        triggered: Optional[PetEvent] = None
+        while schedule and schedule[0][0] <= self._walk_tick:
+            _, _, name = heapq.heappop(schedule)
+            event = self.events[name]
+            self._schedule_event(name)
+            if triggered is None and event.is_eligible(self):
+                triggered = event
+        if triggered is not None:
+            self.active_event = triggered
+            triggered.start(self)
 
     def _activate_event(self, name: str) -> None:
         """Start an event by name if it exists."""
@@ -150,6 +264,20 @@ class VPetEngine:
         else:
             self.event_queue.append(name)
 
+    def advance_to_next_event(self) -> None:
+        """Complete the active event and start the one that plays next.
+
+        An event chained by the finished event's ``on_complete`` callback
+        takes precedence over queued events.
+        """
+        active = self.active_event
+        next_event = active.complete(self) if active is not None else None
+        self.active_event = None
+        if next_event:
+            self._activate_event(next_event)
+        elif self.event_queue:
+            self._activate_event(self.event_queue.popleft())
+
     def _register_default_events(self) -> None:
         """Register built-in events used by the engine."""
         # Happy event may be triggered manually after other events
@@ -184,6 +312,13 @@ class VPetEngine:
         required.update(collect_event_frames(self.events))
         self._required_frame_ids = sorted(required)
 
+        # Sprite keys per direction so the animation loop only does a lookup
+        # (sprites face left by default, flipped ones are used moving right)
+        self._sprite_keys_by_direction = {
+            1: {fid: f"frame_{fid}_flipped" for fid in self._required_frame_ids},
+            -1: {fid: f"frame_{fid}" for fid in self._required_frame_ids},
+        }
+
         if not sprite_dir.exists():
             logger.warning(f"Sprite directory not found: {sprite_dir}")
             self._create_fallback_sprites()
@@ -206,32 +341,56 @@ class VPetEngine:
     def _load_sprites_with_pil(self) -> bool:
         """Load sprites using PIL for better handling and flipping."""
         loaded_count = 0
+        sprite_paths = [
+            Path(self.sprite_directory) / f"{frame_id}.png"
+            for frame_id in self._required_frame_ids
+        ]
+
+        # PNG decoding happens in C with the GIL released, so the frames can
+        # be decoded concurrently; results are stored here in frame order.
+        max_workers = min(len(sprite_paths), os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            decoded = list(executor.map(self._decode_sprite, sprite_paths))
 
         # Load all required frames for walking and registered events
-        for frame_id in self._required_frame_ids:
-            sprite_path = Path(self.sprite_directory) / f"{frame_id}.png"
+        for frame_id, images in zip(self._required_frame_ids, decoded):
+            if images is None:
+                continue
+            pil_image, flipped_image = images
+            self.sprites[f"frame_{frame_id}"] = pil_image
 
-            if sprite_path.exists():
-                try:
-                    # Load original sprite
-                    pil_image = Image.open(sprite_path)
-                    self.sprites[f"frame_{frame_id}"] = pil_image.copy()
+            # Flipped version for right-facing movement
+            self.sprites[f"frame_{frame_id}_flipped"] = flipped_image
+            loaded_count += 1
 
-                    # Create flipped version for right-facing movement
-                    flipped_image = pil_image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                    self.sprites[f"frame_{frame_id}_flipped"] = flipped_image
+        return loaded_count > 0
 
-                    loaded_count += 1
-                    logger.info(f"Loaded sprite: {sprite_path}")
+    @staticmethod
+    def _decode_sprite(sprite_path: Path) -> Optional[Tuple[Any, Any]]:
+        """
+        Decode a sprite file and create its horizontally flipped version.
 
-                except Exception as e:
-                    logger.error(f"Failed to load sprite {sprite_path}: {e}")
-            else:
-                logger.warning(f"Sprite not found: {sprite_path}")
+        Args:
+            sprite_path: Path to the sprite PNG
 
-        # Also load projectile sprite
-        self._load_projectile_sprite()
-        return loaded_count > 0
+        Returns:
+            Tuple of (original, flipped) PIL images, or None on failure
+        """
+        if not sprite_path.exists():
+            logger.warning(f"Sprite not found: {sprite_path}")
+            return None
+
+        try:
+            with Image.open(sprite_path) as pil_image:
+                # Convert once here so the display never has to convert
+                # palette/RGB frames when building its PhotoImages
+                original = pil_image.convert("RGBA")
+            flipped = original.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+            logger.info(f"Loaded sprite: {sprite_path}")
+            return original, flipped
+        except Exception as e:
+            logger.error(f"Failed to load sprite {sprite_path}: {e}")
+            return None
 
     def _load_sprites_basic(self) -> bool:
         """Load sprites using basic method without PIL."""
@@ -257,8 +416,6 @@ class VPetEngine:
             else:
                 logger.warning(f"Sprite not found: {sprite_path}")
 
-        # Also load projectile sprite
-        self._load_projectile_sprite()
         return loaded_count > 0
 
     def _load_projectile_sprite(self) -> None:
@@ -270,8 +427,8 @@ class VPetEngine:
 
         try:
             if PIL_AVAILABLE:
-                pil_image = Image.open(sprite_path)
-                self.projectile_sprites["fireball"] = pil_image.copy()
+                pil_image = Image.open(sprite_path).convert("RGBA")
+                self.projectile_sprites["fireball"] = pil_image
                 self.projectile_sprites["fireball_flipped"] = pil_image.transpose(
                     Image.Transpose.FLIP_LEFT_RIGHT
                 )
@@ -298,6 +455,7 @@ class VPetEngine:
         """Start the VPet animation."""
         self.animation_running = True
         self.is_active = True
+        self._stop_event.clear()
 
         if self.animation_thread is None or not self.animation_thread.is_alive():
             self.animation_thread = threading.Thread(target=self._animation_loop)
@@ -310,6 +468,7 @@ class VPetEngine:
         """Stop the VPet animation."""
         self.animation_running = False
         self.is_active = False
+        self._stop_event.set()
         logger.info("VPet animation stopped")
 
     def set_mode(self, mode: str) -> None:
@@ -331,6 +490,18 @@ class VPetEngine:
 
         logger.info(f"VPet mode set to: {mode}")
 
+    def set_visible(self, visible: bool) -> None:
+        """
+        Inform the VPet engine whether its display is currently visible.
+
+        While hidden (e.g. the window is minimized) the animation thread
+        skips walking, events and projectiles, as none of it would be seen.
+
+        Args:
+            visible: True if the VPet display is shown, False otherwise
+        """
+        self.visible = visible
+
     def set_timer_running(self, is_running: bool) -> None:
         """
         Inform the VPet engine if the Pomodoro timer is running (True) or paused/stopped (False).
@@ -363,6 +534,13 @@ class VPetEngine:
         Returns:
             str: Sprite key for current state
         """
+        sprite_key = self._sprite_keys_by_direction[self.direction].get(
+            self.current_frame
+        )
+        if sprite_key is not None:
+            return sprite_key
+
+        # Frame was not known when sprites were loaded
         base_key = f"frame_{self.current_frame}"
         # Use flipped sprite if moving right (since default sprite faces left)
         if self.direction == 1:
@@ -397,13 +575,9 @@ class VPetEngine:
             start_x = self.x_position - self.projectile_width + overlap
             sprite_key = "fireball"
 
-        projectile = {
-            "x": start_x,
-            "y": y_pos,
-            "direction": self.direction,
-            "sprite_key": sprite_key,
-        }
-        self.projectiles.append(projectile)
+        self.projectiles.append(
+            Projectile(start_x, y_pos, self.direction, sprite_key)
+        )
 
     def _update_projectiles(self, step: float | None = None) -> None:
         """Move projectiles and remove those leaving the canvas.
@@ -412,14 +586,24 @@ class VPetEngine:
             step: Distance each projectile travels for this update. If
                 ``None``, ``self.projectile_speed`` is used.
         """
+        if not self.projectiles:
+            return
         if step is None:
             step = self.projectile_speed
-        remaining = []
+        # Only a handful of projectiles exist at a time, so a plain loop is
+        # cheaper than any vectorised kernel would be to dispatch. The list
+        # is only rebuilt on the rare updates where a projectile leaves.
+        canvas_width = self.canvas_width
+        expired = False
         for proj in self.projectiles:
-            proj["x"] += proj["direction"] * step
-            if 0 <= proj["x"] <= self.canvas_width:
-                remaining.append(proj)
-        self.projectiles = remaining
+            x = proj.x + proj.direction * step
+            proj.x = x
+            if not 0 <= x <= canvas_width:
+                expired = True
+        if expired:
+            self.projectiles = [
+                proj for proj in self.projectiles if 0 <= proj.x <= canvas_width
+            ]
 
     def set_canvas_size(self, width: int, height: int) -> None:
         """
@@ -433,6 +617,7 @@ class VPetEngine:
         self.canvas_height = height
 
         # Recalculate boundaries
+        self._recompute_bounds()
         self._ensure_within_boundaries()
 
     def set_random_walk_parameters(
@@ -459,6 +644,7 @@ class VPetEngine:
             self.direction_change_probability = max(
                 0.001, min(0.1, direction_change_probability)
             )
+            self._ticks_until_turn = None
 
         logger.info(
             f"Random walk parameters updated: min_distance={self.minimum_walk_distance}, "
@@ -468,6 +654,11 @@ class VPetEngine:
     def _animation_loop(self) -> None:
         """Main animation loop running in separate thread with random walk behavior."""
         while self.animation_running:
+            if not self.visible:
+                # Nothing is drawn while hidden, so just wait to be shown
+                self._stop_event.wait(HIDDEN_POLL_INTERVAL)
+                continue
+
             # Get animation parameters based on mode
             move_speed, animation_delay = self._get_animation_parameters()
 
@@ -476,22 +667,15 @@ class VPetEngine:
                 frame, finished = self.active_event.update(self)
                 self.current_frame = frame
                 if finished:
-                    next_event = self.active_event.complete(self)
-                    self.active_event = None
-                    if next_event:
-                        self._activate_event(next_event)
-                    elif self.event_queue:
-                        self._activate_event(self.event_queue.pop(0))
+                    self.advance_to_next_event()
             elif self.event_queue:
-                self._activate_event(self.event_queue.pop(0))
+                self._activate_event(self.event_queue.popleft())
             else:
                 # Normal walking behaviour
-                old_position = self.x_position
                 self.x_position += self.direction * move_speed
 
                 # Update distance walked and possibly change direction
-                distance_moved = abs(self.x_position - old_position)
-                self.distance_walked += distance_moved
+                self.distance_walked += move_speed
                 boundary_hit = self._check_boundaries()
                 if boundary_hit:
                     self.distance_walked = 0
@@ -503,21 +687,18 @@ class VPetEngine:
                 self.walk_frame_index = 1 - self.walk_frame_index
                 self.current_frame = self.walk_frames[self.walk_frame_index]
 
-                # Attempt to trigger any event
-                for event in self.events.values():
-                    if event.should_trigger(self):
-                        self.active_event = event
-                        event.start(self)
-                        break
+                # Trigger the next scheduled event once it is due
+                self._walk_tick += 1
+                self._trigger_due_event()
 
             # Prepare for rendering and smoother projectile motion
-            callback = self.on_position_update_callback
-            root = self.root_window
             sprite_key = self.get_current_sprite_key()
-            y_position = self.canvas_height // 2  # Center vertically
+            y_position = self._center_y  # Center vertically
 
-            # Number of projectile updates within this frame
-            projectile_steps = 3
+            # Number of projectile updates within this frame. Without
+            # projectiles in flight nothing changes between sub-steps, so a
+            # single update covers the whole frame.
+            projectile_steps = 3 if self.projectiles else 1
             step_delay = animation_delay / projectile_steps
             step_distance = self.projectile_speed / projectile_steps
 
@@ -525,29 +706,27 @@ class VPetEngine:
                 # Update active projectiles in small increments
                 self._update_projectiles(step_distance)
 
-                # Runtime type checks to guarantee safe usage
-                if (
-                    callback is not None
-                    and callable(callback)
-                    and root is not None
-                    and hasattr(root, "after")
-                    and callable(getattr(root, "after", None))
-                ):
-                    projectiles_snapshot = [p.copy() for p in self.projectiles]
-
-                    def _cb(
-                        x=self.x_position,
-                        y=y_position,
-                        frame=self.current_frame,
-                        key=sprite_key,
-                        projs=projectiles_snapshot,
-                        cb=callback,
-                    ) -> None:
-                        cb(x, y, frame, key, projs)  # type: ignore[operator]
-
-                    root.after(0, _cb)
-
-                time.sleep(step_delay)
+                # Publish the new state for the GUI thread to render; most
+                # frames have no projectiles and share one empty tuple
+                projectiles = self.projectiles
+                self._render_mailbox.append(
+                    (
+                        self.x_position,
+                        y_position,
+                        self.current_frame,
+                        sprite_key,
+                        (
+                            [(p.x, p.y, p.sprite_key) for p in projectiles]
+                            if projectiles
+                            else ()
+                        ),
+                    )
+                )
+
+                # A stop wakes the wait early; the loop condition decides
+                # whether to exit, since the animation may be restarted
+                if self._stop_event.wait(step_delay):
+                    break
 
     def _get_animation_parameters(self) -> Tuple[int, float]:
         """
@@ -556,12 +735,9 @@ class VPetEngine:
         Returns:
             Tuple[int, float]: (move_speed, animation_delay)
         """
-        if self.current_mode == "work":
-            # Faster movement during work time (pet is training/active)
-            return 3, 0.3
-        else:
-            # Slower movement during break time (pet is relaxing)
-            return 1, 0.7
+        return _MODE_ANIMATION_PARAMETERS.get(
+            self.current_mode, _DEFAULT_ANIMATION_PARAMETERS
+        )
 
     def _check_boundaries(self) -> bool:
         """Check boundaries and reverse direction if needed.
@@ -569,15 +745,15 @@ class VPetEngine:
         Returns:
             bool: True if boundary was hit and direction changed, False otherwise
         """
-        # Calculate boundaries based on canvas width and sprite width
-        right_boundary = self.canvas_width - self.sprite_width - self.margin
-        left_boundary = self.margin
+        x_position = self.x_position
+        right_boundary = self._right_boundary
+        left_boundary = self._left_boundary
 
-        if self.x_position >= right_boundary:
+        if x_position >= right_boundary:
             self.direction = -1
             self.x_position = right_boundary
             return True
-        elif self.x_position <= left_boundary:
+        elif x_position <= left_boundary:
             self.direction = 1
             self.x_position = left_boundary
             return True
@@ -591,10 +767,23 @@ class VPetEngine:
             bool: True if direction should change, False otherwise
         """
         # Only consider changing direction if we've walked the minimum distance
-        if self.distance_walked >= self.minimum_walk_distance:
-            # Random chance to change direction
-            if random.random() < self.direction_change_probability:
-                return True
+        if self.distance_walked < self.minimum_walk_distance:
+            self._ticks_until_turn = None
+            return False
+
+        # Rolling the per-frame chance until it succeeds is geometrically
+        # distributed, so sample the number of frames once per walk segment
+        if self._ticks_until_turn is None:
+            self._ticks_until_turn = sample_trigger_ticks(
+                self.direction_change_probability, self.rng
+            )
+            if self._ticks_until_turn is None:
+                return False
+
+        self._ticks_until_turn -= 1
+        if self._ticks_until_turn <= 0:
+            self._ticks_until_turn = None
+            return True
         return False
 
     def _change_direction_randomly(self) -> None:
@@ -605,10 +794,16 @@ class VPetEngine:
             f"Random direction change: now moving {'right' if self.direction == 1 else 'left'}"
         )
 
+    def _recompute_bounds(self) -> None:
+        """Cache the walking boundaries and vertical center of the canvas."""
+        self._left_boundary = self.margin
+        self._right_boundary = self.canvas_width - self.sprite_width - self.margin
+        self._center_y = self.canvas_height // 2
+
     def _ensure_within_boundaries(self) -> None:
         """Ensure current position is within valid boundaries."""
-        right_boundary = self.canvas_width - self.sprite_width - self.margin
-        left_boundary = self.margin
+        right_boundary = self._right_boundary
+        left_boundary = self._left_boundary
 
         if self.x_position > right_boundary:
             self.x_position = right_boundary
@@ -6,10 +6,20 @@ This script helps you view and analyze your work session data
 logged by the Pomodoro timer application.
 """
 
+import heapq
 import json
 import os
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+
+# Enhanced imports with fallbacks
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 def load_sessions(log_file="./data/work_sessions.json"):
@@ -19,9 +29,13 @@ def load_sessions(log_file="./data/work_sessions.json"):
         return []
 
     try:
-        with open(log_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("sessions", [])
+        if ORJSON_AVAILABLE:
+            with open(log_file, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(log_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        return data.get("sessions", [])
     except Exception as e:
         print(f"Error loading sessions: {e}")
         return []
@@ -38,12 +52,24 @@ def format_duration(minutes):
         return f"{hours:.1f} hours"
 
 
-def get_today_stats(sessions):
+def index_sessions_by_date(sessions):
+    """Group sessions by the date they started, parsing each start time once."""
+    sessions_by_date = defaultdict(list)
+    for session in sessions:
+        start_epoch = session.get("start_epoch")
+        if start_epoch is not None:
+            day = date.fromtimestamp(start_epoch)
+        else:
+            # Sessions logged before start_epoch was recorded
+            day = datetime.fromisoformat(session["start_time"]).date()
+        sessions_by_date[day].append(session)
+    return dict(sessions_by_date)
+
+
+def get_today_stats(sessions_by_date):
     """Get statistics for today."""
     today = datetime.now().date()
-    today_sessions = [
-        s for s in sessions if datetime.fromisoformat(s["start_time"]).date() == today
-    ]
+    today_sessions = sessions_by_date.get(today, [])
 
     total_minutes = sum(s.get("duration_minutes", 0) for s in today_sessions)
     completed = sum(1 for s in today_sessions if s.get("completed", False))
@@ -59,75 +85,62 @@ def get_today_stats(sessions):
 
 def get_stats_by_vpet(sessions):
     """Get statistics grouped by vpet name."""
-    vpet_stats = defaultdict(
-        lambda: {
-            "total_minutes": 0,
-            "session_count": 0,
-            "completed_sessions": 0,
-            "interrupted_sessions": 0,
-        }
-    )
-
+    # Accumulate into flat lists: [total_minutes, session_count, completed]
+    totals = {}
     for session in sessions:
         vpet_name = session.get("vpet_name", "Unknown")
-        stats = vpet_stats[vpet_name]
-
-        stats["total_minutes"] += session.get("duration_minutes", 0)
-        stats["session_count"] += 1
-
+        acc = totals.get(vpet_name)
+        if acc is None:
+            acc = totals[vpet_name] = [0, 0, 0]
+        acc[0] += session.get("duration_minutes", 0)
+        acc[1] += 1
         if session.get("completed", False):
-            stats["completed_sessions"] += 1
-        else:
-            stats["interrupted_sessions"] += 1
-
-    # Calculate success rates
-    for vpet_name, stats in vpet_stats.items():
-        if stats["session_count"] > 0:
-            stats["success_rate"] = (
-                stats["completed_sessions"] / stats["session_count"]
-            ) * 100
-        else:
-            stats["success_rate"] = 0.0
+            acc[2] += 1
+
+    vpet_stats = {}
+    for vpet_name, (total_minutes, session_count, completed) in totals.items():
+        vpet_stats[vpet_name] = {
+            "total_minutes": total_minutes,
+            "session_count": session_count,
+            "completed_sessions": completed,
+            "interrupted_sessions": session_count - completed,
+            "success_rate": (completed / session_count) * 100,
+        }
 
-    return dict(vpet_stats)
+    return vpet_stats
 
 
-def get_today_stats_by_vpet(sessions):
+def get_today_stats_by_vpet(sessions_by_date):
     """Get today's statistics grouped by vpet name."""
     today = datetime.now().date()
-    today_sessions = [
-        s for s in sessions if datetime.fromisoformat(s["start_time"]).date() == today
-    ]
+    return get_stats_by_vpet(sessions_by_date.get(today, []))
 
-    return get_stats_by_vpet(today_sessions)
 
-
-def get_weekly_stats(sessions):
+def get_weekly_stats(sessions_by_date):
     """Get statistics for this week."""
     today = datetime.now().date()
     week_start = today - timedelta(days=today.weekday())
 
-    weekly_sessions = [
-        s
-        for s in sessions
-        if datetime.fromisoformat(s["start_time"]).date() >= week_start
-    ]
-
-    total_minutes = sum(s.get("duration_minutes", 0) for s in weekly_sessions)
-    completed = sum(1 for s in weekly_sessions if s.get("completed", False))
-
-    # Group by day
-    daily_stats = defaultdict(lambda: {"minutes": 0, "sessions": 0})
-    for session in weekly_sessions:
-        day = datetime.fromisoformat(session["start_time"]).date()
-        daily_stats[day]["minutes"] += session.get("duration_minutes", 0)
-        daily_stats[day]["sessions"] += 1
+    total_minutes = 0
+    total_sessions = 0
+    completed = 0
+
+    # Group by day, looking only at the days of this week
+    daily_stats = {}
+    for day, day_sessions in sessions_by_date.items():
+        if day < week_start:
+            continue
+        minutes = sum(s.get("duration_minutes", 0) for s in day_sessions)
+        daily_stats[day] = {"minutes": minutes, "sessions": len(day_sessions)}
+        total_minutes += minutes
+        total_sessions += len(day_sessions)
+        completed += sum(1 for s in day_sessions if s.get("completed", False))
 
     return {
         "total_minutes": total_minutes,
-        "total_sessions": len(weekly_sessions),
+        "total_sessions": total_sessions,
         "completed_sessions": completed,
-        "daily_stats": dict(daily_stats),
+        "daily_stats": daily_stats,
     }
 
 
@@ -144,8 +157,10 @@ def main():
         print("Start using the Pomodoro timer to track your work!")
         return
 
+    sessions_by_date = index_sessions_by_date(sessions)
+
     # Today's stats by VPet
-    today_vpet_stats = get_today_stats_by_vpet(sessions)
+    today_vpet_stats = get_today_stats_by_vpet(sessions_by_date)
     if today_vpet_stats:
         print("📅 TODAY'S WORK BY VPET:")
         for vpet_name, stats in today_vpet_stats.items():
@@ -158,7 +173,7 @@ def main():
         print()
     else:
         # Fallback to overall today's stats
-        today_stats = get_today_stats(sessions)
+        today_stats = get_today_stats(sessions_by_date)
         print("📅 TODAY'S WORK:")
         print(f"   Total time: {format_duration(today_stats['total_minutes'])}")
         print(f"   Sessions: {today_stats['total_sessions']}")
@@ -167,7 +182,7 @@ def main():
         print()
 
     # This week's stats
-    weekly_stats = get_weekly_stats(sessions)
+    weekly_stats = get_weekly_stats(sessions_by_date)
     print("📊 THIS WEEK'S WORK:")
     print(f"   Total time: {format_duration(weekly_stats['total_minutes'])}")
     print(f"   Sessions: {weekly_stats['total_sessions']}")
@@ -210,7 +225,7 @@ def main():
 
     # Recent sessions
     print("🕒 RECENT SESSIONS:")
-    recent_sessions = sorted(sessions, key=lambda x: x["start_time"], reverse=True)[:5]
+    recent_sessions = heapq.nlargest(5, sessions, key=itemgetter("start_time"))
     for session in recent_sessions:
         start_time = datetime.fromisoformat(session["start_time"])
         status = "✓" if session.get("completed", False) else "⏸"
@@ -6,6 +6,7 @@ separated from business logic for better maintainability.
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import filedialog, messagebox
 from typing import Callable, Optional
 
@@ -53,12 +54,19 @@ class PomodoroGUI:
         self.import_btn: Optional[tk.Button] = None
         self.config_window: Optional[tk.Toplevel] = None
         self._digimon_list: list = []
+        # Entries currently shown in the selector menu (None = not populated)
+        self._menu_entries: Optional[tuple] = None
 
         # Current state for display
         self.current_mode = "work"
         self.is_running = False
         self.is_paused = False
 
+        # Last values pushed to the widgets, so unchanged updates can skip Tcl
+        self._last_time_text: Optional[str] = None
+        self._last_mode: Optional[str] = None
+        self._last_button_state: Optional[tuple] = None
+
         self.create_widgets()
 
     def set_callbacks(
@@ -82,13 +90,29 @@ class PomodoroGUI:
         self.on_exit_callback = on_exit
         self.on_events_callback = on_events
 
+    def _create_fonts(self) -> None:
+        """Create the fonts shared by all widgets of this component."""
+        self.mode_font = tkfont.Font(
+            root=self.parent_frame, family="Arial", size=10, weight="bold"
+        )
+        self.time_font = tkfont.Font(
+            root=self.parent_frame, family="Arial", size=20, weight="bold"
+        )
+        self.button_font = tkfont.Font(root=self.parent_frame, family="Arial", size=9)
+        self.size_button_font = tkfont.Font(
+            root=self.parent_frame, family="Arial", size=9, weight="bold"
+        )
+        self.config_font = tkfont.Font(root=self.parent_frame, family="Arial", size=8)
+
     def create_widgets(self) -> None:
         """Create the GUI elements for the Pomodoro timer."""
+        self._create_fonts()
+
         # Mode label with transparent background and white text
         self.mode_label = tk.Label(
             self.parent_frame,
             text="WORK TIME",
-            font=("Arial", 10, "bold"),
+            font=self.mode_font,
             fg="#ffffff",
             bg=self.transparent_color,
         )
@@ -98,7 +122,7 @@ class PomodoroGUI:
         self.time_label = tk.Label(
             self.parent_frame,
             text="25:00",
-            font=("Arial", 20, "bold"),
+            font=self.time_font,
             fg="#ffffff",
             bg=self.transparent_color,
         )
@@ -113,7 +137,7 @@ class PomodoroGUI:
             button_frame,
             text="Start",
             command=self._on_start_pause_clicked,
-            font=("Arial", 9),
+            font=self.button_font,
             bg="#4ecdc4",
             fg="#2c3e50",
             relief="flat",
@@ -128,7 +152,7 @@ class PomodoroGUI:
             button_frame,
             text="Reset",
             command=self._on_reset_clicked,
-            font=("Arial", 9),
+            font=self.button_font,
             bg="#ff7675",
             fg="#2c3e50",
             relief="flat",
@@ -143,7 +167,7 @@ class PomodoroGUI:
             button_frame,
             text="Exit",
             command=self._on_exit_clicked,
-            font=("Arial", 9),
+            font=self.button_font,
             bg="#95a5a6",
             fg="#2c3e50",
             relief="flat",
@@ -159,7 +183,7 @@ class PomodoroGUI:
         self.skip_btn = tk.Button(
             config_frame,
             text="Skip",
-            font=("Arial", 9),
+            font=self.button_font,
             bg="#ffe066",
             fg="#2c3e50",
             relief="flat",
@@ -172,7 +196,7 @@ class PomodoroGUI:
             config_frame,
             text="Config",
             command=self._open_config_window,
-            font=("Arial", 9),
+            font=self.button_font,
             bg="#3498db",
             fg="#ffffff",
             relief="flat",
@@ -186,7 +210,7 @@ class PomodoroGUI:
             config_frame,
             text="Events",
             command=self._on_events_clicked,
-            font=("Arial", 9),
+            font=self.button_font,
             bg="#95a5a6",
             fg="#2c3e50",
             relief="flat",
@@ -202,7 +226,7 @@ class PomodoroGUI:
         self.increase_size_btn = tk.Button(
             size_frame,
             text="+",
-            font=("Arial", 9, "bold"),
+            font=self.size_button_font,
             bg="#b2ff66",
             fg="#2c3e50",
             relief="flat",
@@ -215,7 +239,7 @@ class PomodoroGUI:
         self.decrease_size_btn = tk.Button(
             size_frame,
             text="-",
-            font=("Arial", 9, "bold"),
+            font=self.size_button_font,
             bg="#ffb366",
             fg="#2c3e50",
             relief="flat",
@@ -268,7 +292,7 @@ class PomodoroGUI:
             command=self._on_digimon_changed,
         )
         self.digimon_selector.config(
-            font=("Arial", 8),
+            font=self.config_font,
             bg="#34495e",
             fg="#ffffff",
             activebackground="#2c3e50",
@@ -283,12 +307,13 @@ class PomodoroGUI:
             activeforeground="#ffffff",
         )
         self.digimon_selector.pack(side="left", padx=(0, 5))
+        self._menu_entries = None
 
         self.import_btn = tk.Button(
             digimon_frame,
             text="Import",
             command=self._on_import_clicked,
-            font=("Arial", 8),
+            font=self.config_font,
             bg="#9b59b6",
             fg="#ffffff",
             relief="flat",
@@ -308,6 +333,7 @@ class PomodoroGUI:
             self.config_window = None
         self.digimon_selector = None
         self.import_btn = None
+        self._menu_entries = None
 
     def update_time_display(self, time_text: str) -> None:
         """
@@ -316,7 +342,8 @@ class PomodoroGUI:
         Args:
             time_text: Formatted time string to display
         """
-        if self.time_label:
+        if self.time_label and time_text != self._last_time_text:
+            self._last_time_text = time_text
             self.time_label.config(text=time_text)
 
     def update_mode_display(self, mode: str) -> None:
@@ -328,7 +355,8 @@ class PomodoroGUI:
         """
         self.current_mode = mode
 
-        if self.mode_label:
+        if self.mode_label and mode != self._last_mode:
+            self._last_mode = mode
             if mode == "work":
                 self.mode_label.config(text="WORK TIME", fg="#ffffff")
             else:
@@ -345,7 +373,9 @@ class PomodoroGUI:
         self.is_running = is_running
         self.is_paused = is_paused
 
-        if self.start_pause_btn:
+        button_state = (is_running, is_paused)
+        if self.start_pause_btn and button_state != self._last_button_state:
+            self._last_button_state = button_state
             if not is_running and not is_paused:
                 # Timer is stopped
                 self.start_pause_btn.config(text="Start", bg="#4ecdc4")
@@ -447,16 +477,23 @@ class PomodoroGUI:
         if not self.digimon_selector:
             return
 
-        # Clear existing options
-        menu = self.digimon_selector["menu"]
-        menu.delete(0, "end")
-
-        # Add new options
-        for digimon in digimon_list:
-            menu.add_command(
-                label=digimon,
-                command=tk._setit(self.digimon_var, digimon, self._on_digimon_changed),
-            )
+        # Only rebuild the menu when its entries actually changed
+        entries = tuple(digimon_list)
+        if entries != self._menu_entries:
+            self._menu_entries = entries
+
+            # Clear existing options
+            menu = self.digimon_selector["menu"]
+            menu.delete(0, "end")
+
+            # Add new options
+            for digimon in entries:
+                menu.add_command(
+                    label=digimon,
+                    command=tk._setit(
+                        self.digimon_var, digimon, self._on_digimon_changed
+                    ),
+                )
 
         # Set default if current selection is not in the list
         current_selection = self.digimon_var.get()
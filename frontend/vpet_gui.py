@@ -10,9 +10,18 @@ from typing import Callable, Optional
 
 # Enhanced imports with fallbacks
 try:
-    from PIL import Image, ImageTk
+    from loguru import logger
+except ImportError:
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image, ImageDraw, ImageTk
 
     PIL_AVAILABLE = True
+    # Resampling filter for scaling pixel-art sprites
+    NEAREST = getattr(Image, "NEAREST", 0)
 except ImportError:
     PIL_AVAILABLE = False
 
@@ -49,11 +58,27 @@ class VPetGUI:
         self.vpet_frame: Optional[tk.Frame] = None
         self.vpet_canvas: Optional[tk.Canvas] = None
 
-        # Sprite cache for tkinter PhotoImage objects
+        # Sprite cache for tkinter PhotoImage objects, keyed by sprite key.
+        # Only holds images for the current scale factor (cleared on change).
         self.tk_sprites = {}
+        # Images loaded from file paths, shared by every key using that file
+        # (without PIL both facing directions point at the same PNG)
+        self._tk_sprites_by_path = {}
+        # Pre-rendered fallback pets keyed by (is_work_mode, facing_right)
+        self._fallback_images = {}
+
+        # Canvas items reused across frames, with the image each one shows
+        self._pet_item: Optional[int] = None
+        self._pet_item_image = None
+        self._projectile_items: list = []
+        self._projectile_item_images: list = []
 
         # Current display state
         self.current_mode = "work"
+        # Facing direction for fallback drawing (1 right, -1 left)
+        self._last_direction: Optional[int] = None
+        # What was drawn last, so identical updates can skip the redraw
+        self._last_render_state: Optional[tuple] = None
 
         self.create_widgets()
 
@@ -84,11 +109,12 @@ class VPetGUI:
         self.vpet_frame.pack(pady=(10, 0), fill="x")
 
         # VPet canvas for animation - Keep colored
+        self._canvas_bg = "#34495e"
         self.vpet_canvas = tk.Canvas(
             self.vpet_frame,
             width=self.canvas_width,
             height=self.canvas_height,
-            bg="#34495e",
+            bg=self._canvas_bg,
             highlightthickness=0,
         )
         self.vpet_canvas.pack(padx=5, pady=5)
@@ -107,27 +133,30 @@ class VPetGUI:
         if sprite_data is None:
             return None
 
-        # Check if already cached
-        cache_key = f"{sprite_key}_scale_{getattr(self, 'scale_factor', 1.0)}"
-        if cache_key in self.tk_sprites:
-            return self.tk_sprites[cache_key]
+        # Check if already cached (None marks a sprite that failed to load)
+        if sprite_key in self.tk_sprites:
+            return self.tk_sprites[sprite_key]
 
         try:
             if PIL_AVAILABLE and hasattr(sprite_data, "save"):
                 # PIL Image object
-                scale = getattr(self, 'scale_factor', 1.0)
+                scale = self.scale_factor
                 if abs(scale - 1.0) > 0.01:
                     width, height = sprite_data.size
                     new_size = (int(width * scale), int(height * scale))
-                    resized_image = sprite_data.resize(new_size, Image.NEAREST if hasattr(Image, 'NEAREST') else 0)
+                    resized_image = sprite_data.resize(new_size, NEAREST)
                 else:
                     resized_image = sprite_data
-                cache_key = f"{sprite_key}_scale_{scale}"
                 tk_image = ImageTk.PhotoImage(resized_image)
-                self.tk_sprites[cache_key] = tk_image
+                self.tk_sprites[sprite_key] = tk_image
                 return tk_image
             elif isinstance(sprite_data, str):
                 # File path
+                tk_image = self._tk_sprites_by_path.get(sprite_data)
+                if tk_image is not None:
+                    self.tk_sprites[sprite_key] = tk_image
+                    return tk_image
+
                 tk_image = tk.PhotoImage(file=sprite_data)
                 scale = self.scale_factor
                 if abs(scale - 1.0) > 0.01:
@@ -135,17 +164,33 @@ class VPetGUI:
                         tk_image = tk_image.zoom(int(scale * 100), int(scale * 100))
                         tk_image = tk_image.subsample(100, 100)
                     except Exception as e:
-                        print(f"Zoom failed: {e}")
-                cache_key = f"{sprite_key}_scale_{scale}"
-                self.tk_sprites[cache_key] = tk_image
+                        logger.warning(f"Zoom failed for sprite {sprite_key}: {e}")
+                self._tk_sprites_by_path[sprite_data] = tk_image
+                self.tk_sprites[sprite_key] = tk_image
                 return tk_image
             else:
                 # Unknown format
+                self.tk_sprites[sprite_key] = None
                 return None
         except Exception as e:
-            print(f"Error loading sprite {sprite_key}: {e}")
+            # Remember the failure so it is not retried on every frame
+            logger.error(f"Error loading sprite {sprite_key}: {e}")
+            self.tk_sprites[sprite_key] = None
             return None
 
+    def preload_sprites(self, sprites: dict) -> None:
+        """
+        Convert sprites into display images ahead of rendering.
+
+        This keeps the decode/resize work out of the per-frame render path.
+        Must be called again after the sprite cache has been cleared.
+
+        Args:
+            sprites: Mapping of sprite key to sprite data
+        """
+        for sprite_key, sprite_data in sprites.items():
+            self.load_sprite_for_display(sprite_data, sprite_key)
+
     def update_vpet_display(
         self,
         x_position: int,
@@ -171,27 +216,92 @@ class VPetGUI:
 
         self.current_mode = current_mode
 
-        # Clear canvas
-        self.vpet_canvas.delete("all")
+        # Nothing to do if the pet and projectiles are where they were drawn.
+        # The fallback drawing faces the direction hint, so it is part of the key.
+        render_state = (
+            x_position,
+            y_position,
+            sprite_key,
+            current_mode,
+            self._last_direction,
+            tuple([(px, py, key) for px, py, _, key in projectiles])
+            if projectiles
+            else (),
+        )
+        if render_state == self._last_render_state:
+            return
+        self._last_render_state = render_state
+
+        # Bound methods used for every item drawn this frame. Existing canvas
+        # items are moved and retargeted instead of recreated each frame.
+        canvas = self.vpet_canvas
+        create_image = canvas.create_image
+        coords = canvas.coords
+        itemconfigure = canvas.itemconfigure
+        load_sprite = self.load_sprite_for_display
+
+        # Remove primitives of a previous PIL-less fallback drawing
+        canvas.delete("fallback")
 
         # Try to load and display sprite
-        tk_sprite = self.load_sprite_for_display(sprite_data, sprite_key)
+        tk_sprite = load_sprite(sprite_data, sprite_key)
+        pet_x = x_position
+        if not tk_sprite and PIL_AVAILABLE:
+            # Pre-rendered fallback, shifted so its outline lines up
+            tk_sprite = self._get_fallback_image(
+                current_mode == "work", self._last_direction == 1
+            )
+            pet_x -= 1
 
         if tk_sprite:
             # Display the sprite
-            self.vpet_canvas.create_image(
-                x_position, y_position, image=tk_sprite, anchor="w"
-            )
+            if self._pet_item is None:
+                self._pet_item = create_image(
+                    pet_x, y_position, image=tk_sprite, anchor="w"
+                )
+            else:
+                coords(self._pet_item, pet_x, y_position)
+                if tk_sprite is not self._pet_item_image:
+                    itemconfigure(self._pet_item, image=tk_sprite)
+            self._pet_item_image = tk_sprite
         else:
             # Fallback: draw a simple shape
+            if self._pet_item is not None:
+                canvas.delete(self._pet_item)
+                self._pet_item = None
+                self._pet_item_image = None
             self._draw_fallback_vpet(x_position, y_position)
 
         # Draw projectiles if any
+        items = self._projectile_items
+        item_images = self._projectile_item_images
+        shown = 0
         if projectiles:
+            # All projectiles share a couple of sprites; resolve each once
+            frame_sprites = {}
             for px, py, psprite_data, psprite_key in projectiles:
-                tk_proj = self.load_sprite_for_display(psprite_data, psprite_key)
-                if tk_proj:
-                    self.vpet_canvas.create_image(px, py, image=tk_proj, anchor="w")
+                if psprite_key in frame_sprites:
+                    tk_proj = frame_sprites[psprite_key]
+                else:
+                    tk_proj = load_sprite(psprite_data, psprite_key)
+                    frame_sprites[psprite_key] = tk_proj
+                if not tk_proj:
+                    continue
+                if shown < len(items):
+                    coords(items[shown], px, py)
+                    if tk_proj is not item_images[shown]:
+                        itemconfigure(items[shown], image=tk_proj)
+                        item_images[shown] = tk_proj
+                else:
+                    items.append(create_image(px, py, image=tk_proj, anchor="w"))
+                    item_images.append(tk_proj)
+                shown += 1
+
+        # Drop items of projectiles that are no longer shown
+        if shown < len(items):
+            canvas.delete(*items[shown:])
+            del items[shown:]
+            del item_images[shown:]
 
     def _draw_fallback_vpet(self, x_position: int, y_position: int) -> None:
         """
@@ -204,6 +314,8 @@ class VPetGUI:
         if not self.vpet_canvas:
             return
 
+        facing_right = self._last_direction == 1
+
         # Color based on mode
         rect_color = "#e74c3c" if self.current_mode == "work" else "#27ae60"
 
@@ -218,13 +330,12 @@ class VPetGUI:
             fill=rect_color,
             outline="white",
             width=2,
+            tags="fallback",
         )
 
         # Draw direction indicator (triangle)
         triangle_size = 5
-        if (
-            hasattr(self, "_last_direction") and self._last_direction == 1
-        ):  # Moving right
+        if facing_right:  # Moving right
             points = [
                 x_position + body_width - triangle_size,
                 y_position - triangle_size,
@@ -243,7 +354,9 @@ class VPetGUI:
                 y_position,
             ]
 
-        self.vpet_canvas.create_polygon(points, fill="white", outline="white")
+        self.vpet_canvas.create_polygon(
+            points, fill="white", outline="white", tags="fallback"
+        )
 
         # Draw eyes
         eye_size = 2
@@ -255,6 +368,7 @@ class VPetGUI:
             eye_y + eye_size,
             fill="white",
             outline="white",
+            tags="fallback",
         )
         self.vpet_canvas.create_oval(
             x_position + 15 - eye_size,
@@ -263,8 +377,50 @@ class VPetGUI:
             eye_y + eye_size,
             fill="white",
             outline="white",
+            tags="fallback",
         )
 
+    def _get_fallback_image(self, is_work_mode: bool, facing_right: bool):
+        """
+        Get the pre-rendered fallback VPet for a mode and facing direction.
+
+        The image matches the canvas primitives drawn without PIL, shifted
+        by one pixel so the outline fits inside it.
+
+        Args:
+            is_work_mode: Whether the timer is in work mode
+            facing_right: Whether the pet is moving right
+
+        Returns:
+            PhotoImage of the fallback VPet
+        """
+        key = (is_work_mode, facing_right)
+        tk_image = self._fallback_images.get(key)
+        if tk_image is not None:
+            return tk_image
+
+        rect_color = "#e74c3c" if is_work_mode else "#27ae60"
+        image = Image.new("RGBA", (22, 22), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+
+        # Main body with a white outline
+        draw.rectangle((0, 0, 21, 21), fill=rect_color, outline="white", width=2)
+
+        # Direction indicator (triangle)
+        if facing_right:
+            points = [(16, 6), (16, 16), (21, 11)]
+        else:
+            points = [(6, 6), (6, 16), (1, 11)]
+        draw.polygon(points, fill="white", outline="white")
+
+        # Eyes
+        draw.ellipse((4, 4, 8, 8), fill="white", outline="white")
+        draw.ellipse((14, 4, 18, 8), fill="white", outline="white")
+
+        tk_image = ImageTk.PhotoImage(image)
+        self._fallback_images[key] = tk_image
+        return tk_image
+
     def set_direction_hint(self, direction: int) -> None:
         """
         Set direction hint for fallback drawing.
@@ -276,6 +432,11 @@ class VPetGUI:
 
     def clear_display(self) -> None:
         """Clear the VPet display."""
+        self._last_render_state = None
+        self._pet_item = None
+        self._pet_item_image = None
+        self._projectile_items.clear()
+        self._projectile_item_images.clear()
         if self.vpet_canvas:
             self.vpet_canvas.delete("all")
 
@@ -290,19 +451,25 @@ class VPetGUI:
 
         # You could add mode-specific visual effects here
         # For example, changing canvas background color slightly
-        if self.vpet_canvas:
-            if mode == "work":
-                # Slightly more intense background during work
-                self.vpet_canvas.config(bg="#2c3e50")
-            else:
-                # Calmer background during break
-                self.vpet_canvas.config(bg="#34495e")
+        if mode == "work":
+            # Slightly more intense background during work
+            bg = "#2c3e50"
+        else:
+            # Calmer background during break
+            bg = "#34495e"
+
+        # Reconfiguring the canvas repaints it, so only do so on a change
+        if self.vpet_canvas and bg != self._canvas_bg:
+            self._canvas_bg = bg
+            self.vpet_canvas.config(bg=bg)
 
     def clear_sprite_cache(self) -> None:
         """
         Clear the cached PhotoImage sprites to force reload from new sprite data.
         """
         self.tk_sprites.clear()
+        self._tk_sprites_by_path.clear()
+        self._last_render_state = None
 
     def get_canvas_size(self) -> tuple:
         """
@@ -10,6 +10,9 @@
 from PIL import Image
 from PIL.Image import Transpose
 
+# --- Magnification option ---
+MAGNIFICATION = 4  # Set to 1, 2, 4, or 8
+
 # Load the sprite sheet
 sheet = Image.open("input_spritesheet.png").convert("RGBA")
 
@@ -17,13 +20,22 @@ FRAME_WIDTH = 24
 FRAME_HEIGHT = 24
 N_FRAMES = 8
 
+# Magnify the whole sheet once; NEAREST scaling by an integer factor gives
+# the same pixels as magnifying every composited output frame afterwards.
+# All positions below stay in unmagnified pixels.
+if MAGNIFICATION > 1:
+    sheet = sheet.resize(
+        (sheet.width * MAGNIFICATION, sheet.height * MAGNIFICATION),
+        resample=Image.Resampling.NEAREST,
+    )
+
 # Slice out the 6 frames in a list
 frames = []
 for i in range(N_FRAMES):
-    left = i * FRAME_WIDTH
+    left = i * FRAME_WIDTH * MAGNIFICATION
     upper = 0
-    right = left + FRAME_WIDTH
-    lower = FRAME_HEIGHT
+    right = left + FRAME_WIDTH * MAGNIFICATION
+    lower = FRAME_HEIGHT * MAGNIFICATION
     frame = sheet.crop((left, upper, right, lower))
     frames.append(frame)
 # frames[0] = walk left 1
@@ -46,6 +58,25 @@ SPRITE_Y = 0  # y position is fixed (top-aligned)
 
 frames_out = []
 
+
+def compose(sprite, x):
+    """Place a sprite on a transparent background at horizontal offset x."""
+    bg = Image.new(
+        "RGBA",
+        (BG_WIDTH * MAGNIFICATION, BG_HEIGHT * MAGNIFICATION),
+        (0, 0, 0, 0),
+    )
+    x *= MAGNIFICATION
+    # Frames where the sprite is entirely outside the background stay empty.
+    # The background is fully transparent, so copying the sprite over it
+    # without a mask gives the same result as blending it in. It uses the
+    # sheet's (0, 0, 0, 0) transparent pixel so every clear pixel is
+    # identical, which keeps the GIF palettes small.
+    if -sprite.width < x < bg.width:
+        bg.paste(sprite, (x, SPRITE_Y * MAGNIFICATION))
+    return bg
+
+
 # Define the animation sequence as (type, frame_image, x_offset)
 
 # 1. Walk in from left to center (step length sync mechanics)
@@ -70,110 +101,40 @@ for i in range(walk_total_frames):
     anim_idx = i % 2
     walk_frame = walk_anim_frames[anim_idx]
     x = int(start_x + (i * move_per_frame))
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(walk_frame, (x, SPRITE_Y), walk_frame)
-    frames_out.append(bg)
-
-# 1.5 Pause a bit at center
-idle_frames = [frames[0]]
-idle_steps = 1
-for i in range(idle_steps):
-    happy_frame = idle_frames[i % 2]
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(happy_frame, (center_x, SPRITE_Y), happy_frame)
-    frames_out.append(bg)
-
-# 1.5 Pause a bit at center
-idle_frames = [frames[0]]
-idle_steps = 1
-for i in range(idle_steps):
-    happy_frame = idle_frames[i % 2]
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(happy_frame, (center_x, SPRITE_Y), happy_frame)
-    frames_out.append(bg)
-
-# 2. Stand happy (center)
-happy_frames = [frames[3], frames[2]]
-happy_steps = 7
-for i in range(happy_steps):
-    happy_frame = happy_frames[i % 2]
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(happy_frame, (center_x, SPRITE_Y), happy_frame)
-    frames_out.append(bg)
-
-# 2.5 Pause a bit at center
-idle_frames = [frames[0], frames[0]]
-idle_steps = 1
-for i in range(idle_steps):
-    happy_frame = idle_frames[i % 2]
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(happy_frame, (center_x, SPRITE_Y), happy_frame)
-    frames_out.append(bg)
-
-
-# 3. Attack (center)
-attack_frames = [frames[4], frames[7]]
-attack_steps = 5
-for i in range(attack_steps):
-    attack_frame = attack_frames[i % 2]
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(attack_frame, (center_x, SPRITE_Y), attack_frame)
-    frames_out.append(bg)
-
-# # 3.5 Pause a bit at center
-# idle_frames = [frames[0], frames[4]]
-# idle_steps = 1
-# for i in range(idle_steps):
-#     happy_frame = idle_frames[i % 2]
-#     bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-#     bg.paste(happy_frame, (center_x, SPRITE_Y), happy_frame)
-#     frames_out.append(bg)
-
-
-# 4. sleep (center)
-sleep_frames = [frames[6], frames[6]]
-sleep_steps = 6
-for i in range(sleep_steps):
-    sleep_frame = sleep_frames[i % 2]
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(sleep_frame, (center_x, SPRITE_Y), sleep_frame)
-    frames_out.append(bg)
-
-# 4.5 Pause a bit at center
-idle_frames = [frames[4], frames[0]]
-idle_steps = 2
-for i in range(idle_steps):
-    happy_frame = idle_frames[i % 2]
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(happy_frame, (center_x, SPRITE_Y), happy_frame)
-    frames_out.append(bg)
-
-# 5. Happy (center again)
-happy_steps_2 = 3
-for i in range(happy_steps_2):
-    happy_frame = happy_frames[i % 2]
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(happy_frame, (center_x, SPRITE_Y), happy_frame)
-    frames_out.append(bg)
-
-# 5.5 Pause a bit at center
-
-idle_frames = [frames[0]]
-idle_steps = 1
-for i in range(idle_steps):
-    happy_frame = idle_frames[i % 2]
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(happy_frame, (center_x, SPRITE_Y), happy_frame)
-    frames_out.append(bg)
-
-# # 1.5 Pause a bit at center
-# idle_frames = [frames[0], frames[1]]
-# idle_steps = 2
-# for i in range(idle_steps):
-#     happy_frame = idle_frames[i % 2]
-#     bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-#     bg.paste(happy_frame, (center_x, SPRITE_Y), happy_frame)
-#     frames_out.append(bg)
+    frames_out.append(compose(walk_frame, x))
+
+# 2.-5. Actions at the center, as (sprite frame indices, number of steps).
+# Each step shows the next index in the tuple, cycling through it.
+CENTER_SEQUENCE = [
+    ((0,), 1),  # 1.5 Pause a bit at center
+    ((0,), 1),  # 1.5 Pause a bit at center
+    ((3, 2), 7),  # 2. Stand happy
+    ((0,), 1),  # 2.5 Pause a bit at center
+    ((4, 7), 5),  # 3. Attack
+    ((6,), 6),  # 4. Sleep
+    ((4, 0), 2),  # 4.5 Pause a bit at center
+    ((3, 2), 3),  # 5. Happy again
+    ((0,), 1),  # 5.5 Pause a bit at center
+]
+
+
+# Composited frames by (sprite frame index, x). Frames are never modified
+# after composing, so repeats of a pose can share one image.
+static_frames = {}
+
+
+def emit(indices, steps, x=center_x):
+    """Append steps frames cycling through the given sprite frames at x."""
+    for i in range(steps):
+        key = (indices[i % len(indices)], x)
+        frame = static_frames.get(key)
+        if frame is None:
+            frame = static_frames[key] = compose(frames[key[0]], x)
+        frames_out.append(frame)
+
+
+for indices, steps in CENTER_SEQUENCE:
+    emit(indices, steps)
 
 # 5. Walk out to left (step length sync mechanics)
 end_x = -FRAME_WIDTH
@@ -186,22 +147,10 @@ for i in range(walk_total_frames_out):
     anim_idx = i % 2
     walk_frame = frames[0] if anim_idx == 0 else frames[1]  # walk left
     x = int(center_x - (i * move_per_frame_out))
-    bg = Image.new("RGBA", (BG_WIDTH, BG_HEIGHT), (255, 255, 255, 0))
-    bg.paste(walk_frame, (x, SPRITE_Y), walk_frame)
-    frames_out.append(bg)
+    frames_out.append(compose(walk_frame, x))
 
-# --- Magnification option ---
-MAGNIFICATION = 4  # Set to 1, 2, 4, or 8
-if MAGNIFICATION > 1:
-    scaled_frames = [
-        f.resize(
-            (f.width * MAGNIFICATION, f.height * MAGNIFICATION),
-            resample=Image.Resampling.NEAREST,
-        )
-        for f in frames_out
-    ]
-else:
-    scaled_frames = frames_out
+# Frames are composited at full magnification already
+scaled_frames = frames_out
 
 # --- Save as gif (after all frames have been generated) ---
 import os
@@ -6,7 +6,7 @@
 # Requires: Pillow (pip install pillow)
 
 import sys, json, math, pathlib
-from PIL import Image, ImageDraw
+from PIL import Image
 
 
 def parse_gpl(path):
@@ -55,21 +55,24 @@ def parse_rpl(path):
         else:
             items = []
 
+    def hex_rgb(hexstr):
+        # One int parse of "#RRGGBB" and shifts instead of three slices
+        v = int(hexstr[1:7], 16)
+        return (v >> 16 & 0xFF, v >> 8 & 0xFF, v & 0xFF)
+
     def as_rgb(item):
         if isinstance(item, dict):
+            color = item.get("color")
             if (
-                "color" in item
-                and isinstance(item["color"], str)
-                and item["color"].startswith("#")
-                and len(item["color"]) in (7, 9)
+                isinstance(color, str)
+                and color.startswith("#")
+                and len(color) in (7, 9)
             ):
-                hexv = item["color"][1:7]
-                return tuple(int(hexv[i : i + 2], 16) for i in (0, 2, 4))
+                return hex_rgb(color)
             if all(k in item for k in ("r", "g", "b")):
                 return (int(item["r"]), int(item["g"]), int(item["b"]))
         if isinstance(item, str) and item.startswith("#") and len(item) >= 7:
-            hexv = item[1:7]
-            return tuple(int(hexv[i : i + 2], 16) for i in (0, 2, 4))
+            return hex_rgb(item)
         return None
 
     colors = []
@@ -102,14 +105,13 @@ def make_palette_png(colors, out_path, cell=32, cols=None, margin=8, gap=4):
     H = margin * 2 + rows * cell + (rows - 1) * gap
 
     img = Image.new("RGB", (W, H), (255, 255, 255))
-    draw = ImageDraw.Draw(img)
 
-    for idx, (r, g, b) in enumerate(colors):
-        r_i = idx // cols
-        c_i = idx % cols
+    # Pasting a solid color fills the box directly, without ImageDraw
+    for idx, rgb in enumerate(colors):
+        r_i, c_i = divmod(idx, cols)
         x0 = margin + c_i * (cell + gap)
         y0 = margin + r_i * (cell + gap)
-        draw.rectangle([x0, y0, x0 + cell - 1, y0 + cell - 1], fill=(r, g, b))
+        img.paste(rgb, (x0, y0, x0 + cell, y0 + cell))
     img.save(out_path)
 
 
@@ -5,8 +5,10 @@
 
 import os
 import random
+from functools import lru_cache
 
 import imageio.v2 as imageio
+import numpy as np
 from PIL import Image, ImageSequence
 
 SPRITE_PATHS = [
@@ -14,7 +16,7 @@ SPRITE_PATHS = [
     "hyokomon.png",
     "sheomon.png",
 ]
-BG_COLOR = (200, 220, 255, 255)  # light blue
+BG_COLOR = (200, 220, 255)  # light blue
 WIDTH, HEIGHT = 640, 360
 FPS = 15
 DURATION_SEC = 15  # total duration
@@ -22,7 +24,9 @@ N_FRAMES = FPS * DURATION_SEC
 N_SPRITES = len(SPRITE_PATHS)
 
 
-# Helper: load and scale sprite
+# Helper: load and scale sprite. Cached per path, so sprites sharing a file
+# share one decoded image; Sprite never modifies it in place.
+@lru_cache(maxsize=None)
 def load_sprite(path, scale=2):
     im = Image.open(path).convert("RGBA")
     w, h = im.size
@@ -32,6 +36,8 @@ def load_sprite(path, scale=2):
 class Sprite:
     def __init__(self, image, bounds):
         self.image = image
+        # Both orientations, indexed by self.flip
+        self._images = (image, image.transpose(Image.Transpose.FLIP_LEFT_RIGHT))
         self.w, self.h = image.size
         self.bounds = bounds
         self.x = random.randint(0, bounds[0] - self.w)
@@ -74,29 +80,25 @@ class Sprite:
         # Attack/idle: maybe do a little bounce or blink (future)
 
     def render(self, bg):
-        im = (
-            self.image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-            if self.flip
-            else self.image
-        )
+        im = self._images[self.flip]
         bg.paste(im, (int(self.x), int(self.y)), im)
 
 
 # Load all sprites
 sprites = [Sprite(load_sprite(p), (WIDTH, HEIGHT)) for p in SPRITE_PATHS]
 
-frames = []
-for t in range(N_FRAMES):
-    bg = Image.new("RGBA", (WIDTH, HEIGHT), BG_COLOR)
-    for sprite in sprites:
-        sprite.update()
-        sprite.render(bg)
-    frames.append(bg)
-
-# Write as mp4
+# Render and write as mp4, handing each frame to the encoder as soon as it
+# is composited instead of keeping the whole video in memory
 fname = "output_wallpaper.mp4"
 with imageio.get_writer(fname, fps=FPS, codec="libx264", quality=8) as w:
-    for f in frames:
-        w.append_data(imageio.core.util.Array(f.convert("RGB")))
+    for t in range(N_FRAMES):
+        # Opaque RGB canvas: sprites are pasted through their own alpha mask,
+        # so frames are ready for the encoder without a convert("RGB")
+        bg = Image.new("RGB", (WIDTH, HEIGHT), BG_COLOR)
+        for sprite in sprites:
+            sprite.update()
+            sprite.render(bg)
+        # imageio takes plain arrays; no extra Array wrapper object needed
+        w.append_data(np.asarray(bg))
 
 print(f"Wrote {fname}.")
@@ -1,4 +1,5 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 from PIL import Image
 
@@ -18,8 +19,9 @@ Where SHEET.png is your input sprite sheet, ROWS and COLS are the grid size, and
     parser.add_argument("outdir", help="Output directory for the sprites")
     args = parser.parse_args()
 
-    # Open the sprite sheet image
+    # Open the sprite sheet image and decode it once up front
     img = Image.open(args.sheet)
+    img.load()
 
     sprite_width = 48
     sprite_height = 48
@@ -69,10 +71,8 @@ Where SHEET.png is your input sprite sheet, ROWS and COLS are the grid size, and
             except Exception:
                 print("Invalid format. Use row,col with integers.")
 
-    # Now slice only the selected sprites
-    for action, idx in grid_choices.items():
-        row = idx // args.cols
-        col = idx % args.cols
+    def save_sprite(action, idx):
+        row, col = divmod(idx, args.cols)
         left = col * sprite_width
         upper = row * sprite_height
         right = left + sprite_width
@@ -80,6 +80,16 @@ Where SHEET.png is your input sprite sheet, ROWS and COLS are the grid size, and
         sprite = img.crop((left, upper, right, lower))
         out_path = os.path.join(args.outdir, action_to_filename[action])
         sprite.save(out_path, format="PNG")
-        print(f"Saved {action} sprite to {out_path}")
+        return out_path
+
+    # Now slice only the selected sprites; PNG compression releases the GIL,
+    # so the encodes run in parallel threads
+    with ThreadPoolExecutor() as pool:
+        futures = {
+            action: pool.submit(save_sprite, action, idx)
+            for action, idx in grid_choices.items()
+        }
+        for action, future in futures.items():
+            print(f"Saved {action} sprite to {future.result()}")
 
 # import PIL
@@ -1,8 +1,11 @@
+import io
 import os
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from tkinter import filedialog, messagebox, ttk
 
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 
 # Action to output filename mapping
 ACTION_TO_FILENAME = {
@@ -16,20 +19,28 @@ ACTION_TO_FILENAME = {
 ACTIONS = list(ACTION_TO_FILENAME.keys())
 
 
+def png_bytes(image):
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
 class SpriteSlicerGUI(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Sprite Slicer GUI")
         self.geometry("800x600")
         self.sheet_img = None
+        self.sheet_preview = None
         self.tk_img = None
         self.sprite_width = tk.IntVar(value=48)
         self.sprite_height = tk.IntVar(value=48)
         self.sheet_path = tk.StringVar()
-        self.sliced_images = []
+        self.slice_boxes = []
         self.rows = 0
         self.cols = 0
         self.action_assignments = {a: None for a in ACTIONS}
+        self.assigned_indices = set()
 
         self.build_main_frame()
 
@@ -47,6 +58,8 @@ class SpriteSlicerGUI(tk.Tk):
 
         self.canvas = tk.Canvas(self, width=480, height=480)
         self.canvas.pack(pady=10)
+        # Single image item showing the sheet preview, swapped via itemconfigure
+        self.canvas_image = self.canvas.create_image(0, 0, anchor=tk.NW)
 
         self.next_button = ttk.Button(
             self, text="Preview Slices", command=self.preview_slices
@@ -66,12 +79,26 @@ class SpriteSlicerGUI(tk.Tk):
         self.sheet_label.config(text=os.path.basename(path))
         try:
             self.sheet_img = Image.open(path)
-            self.tk_img = ImageTk.PhotoImage(self.sheet_img.resize((480, 480)))
-            self.canvas.delete("all")
-            self.canvas.create_image(0, 0, anchor=tk.NW, image=self.tk_img)
+            preview_src = self.sheet_img
+            if self.sheet_img.format == "JPEG":
+                # Let the JPEG decoder scale down while decoding the preview;
+                # the full resolution sheet is still used for slicing
+                preview_src = Image.open(path)
+                preview_src.draft("RGB", (480, 480))
+            # Pixel art sheets: NEAREST keeps the preview crisp and is fastest
+            self.sheet_preview = preview_src.resize(
+                (480, 480), Image.Resampling.NEAREST
+            )
+            if self.tk_img is None:
+                # One 480x480 photo image is reused for every preview update
+                self.tk_img = ImageTk.PhotoImage("RGBA", (480, 480))
+                self.canvas.itemconfigure(self.canvas_image, image=self.tk_img)
+            # Image.convert applies palette transparency, paste alone would not
+            self.tk_img.paste(self.sheet_preview.convert("RGBA"))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load image: {e}")
             self.sheet_img = None
+            self.sheet_preview = None
             self.tk_img = None
 
     def preview_slices(self):
@@ -82,32 +109,32 @@ class SpriteSlicerGUI(tk.Tk):
         w, h = self.sheet_img.size
         self.cols = w // sw
         self.rows = h // sh
-        # Draw grid
-        self.canvas.delete("all")
-        self.tk_img = ImageTk.PhotoImage(self.sheet_img.resize((480, 480)))
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.tk_img)
+        # Draw the grid into a copy of the preview built by load_sheet, so the
+        # canvas gets one image instead of a line item per row and column
+        grid_img = self.sheet_preview.convert("RGBA")
+        draw = ImageDraw.Draw(grid_img)
         scale_x = 480 / w
         scale_y = 480 / h
         for r in range(self.rows):
             y = int(r * sh * scale_y)
-            self.canvas.create_line(0, y, 480, y, fill="red")
+            draw.line((0, y, 480 - 1, y), fill="red")
         for c in range(self.cols):
             x = int(c * sw * scale_x)
-            self.canvas.create_line(x, 0, x, 480, fill="red")
-        self.canvas.create_line(0, 480 - 1, 480 - 1, 480 - 1, fill="red")
-        self.canvas.create_line(480 - 1, 0, 480 - 1, 480 - 1, fill="red")
-        # Prep slice images
-        self.sliced_images = []
-        for r in range(self.rows):
-            for c in range(self.cols):
-                left = c * sw
-                upper = r * sh
-                right = left + sw
-                lower = upper + sh
-                sprite = self.sheet_img.crop((left, upper, right, lower))
-                self.sliced_images.append(sprite)
-        # Move to action assignment UI
-        self.after(500, self.action_assignment_ui)
+            draw.line((x, 0, x, 480 - 1), fill="red")
+        draw.line((0, 480 - 1, 480 - 1, 480 - 1), fill="red")
+        draw.line((480 - 1, 0, 480 - 1, 480 - 1), fill="red")
+        self.tk_img.paste(grid_img)
+        # Prep slice boxes; sprites are only cropped once they are shown or saved
+        self.slice_boxes = [
+            (c * sw, r * sh, c * sw + sw, r * sh + sh)
+            for r in range(self.rows)
+            for c in range(self.cols)
+        ]
+        # Move to action assignment UI as soon as Tk is idle
+        self.after_idle(self.action_assignment_ui)
+
+    def get_slice(self, idx):
+        return self.sheet_img.crop(self.slice_boxes[idx])
 
     def action_assignment_ui(self):
         self.canvas.pack_forget()
@@ -121,9 +148,11 @@ class SpriteSlicerGUI(tk.Tk):
         btn_frame = ttk.Frame(self.action_frame)
         btn_frame.pack(pady=10)
         self.action_btns = []
+        # Last state set on each action button, to skip no-op Tk updates
+        self.action_btn_states = [tk.NORMAL] * len(ACTIONS)
         for action in ACTIONS:
             btn = ttk.Button(
-                btn_frame, text=action, command=lambda a=action: self.assign_action(a)
+                btn_frame, text=action, command=partial(self.assign_action, action)
             )
             btn.pack(side=tk.LEFT, padx=4)
             self.action_btns.append(btn)
@@ -134,30 +163,30 @@ class SpriteSlicerGUI(tk.Tk):
         self.display_sprite()
 
     def display_sprite(self):
-        if self.current_idx >= len(self.sliced_images):
+        if self.current_idx >= len(self.slice_boxes):
             self.status_label.config(
                 text="All sprites processed! Saving assigned actions..."
             )
             self.save_sprites()
             return
-        sprite = self.sliced_images[self.current_idx]
-        sprite_img = ImageTk.PhotoImage(sprite.resize((96, 96)))
+        sprite = self.get_slice(self.current_idx)
+        sprite_img = ImageTk.PhotoImage(
+            sprite.resize((96, 96), Image.Resampling.NEAREST)
+        )
         self.sprite_label.config(image=sprite_img)
         self.sprite_label.image = sprite_img
-        used = set(self.action_assignments.values())
+        sprite_used = self.current_idx in self.assigned_indices
+        btn_states = self.action_btn_states
         for i, action in enumerate(ACTIONS):
-            if self.current_idx in used:
-                self.action_btns[i]["state"] = tk.DISABLED
+            if sprite_used or self.action_assignments[action] is not None:
+                state = tk.DISABLED
             else:
-                if (
-                    action in self.action_assignments
-                    and self.action_assignments[action] is not None
-                ):
-                    self.action_btns[i]["state"] = tk.DISABLED
-                else:
-                    self.action_btns[i]["state"] = tk.NORMAL
+                state = tk.NORMAL
+            if btn_states[i] != state:
+                self.action_btns[i]["state"] = state
+                btn_states[i] = state
         self.status_label.config(
-            text=f"Sprite {self.current_idx+1} / {len(self.sliced_images)}"
+            text=f"Sprite {self.current_idx+1} / {len(self.slice_boxes)}"
         )
 
     def assign_action(self, action):
@@ -166,13 +195,13 @@ class SpriteSlicerGUI(tk.Tk):
                 "Already assigned", f"Action {action} already has a sprite assigned."
             )
             return
-        used = set(self.action_assignments.values())
-        if self.current_idx in used:
+        if self.current_idx in self.assigned_indices:
             messagebox.showerror(
                 "Already used", f"This sprite is already assigned to another action."
             )
             return
         self.action_assignments[action] = self.current_idx
+        self.assigned_indices.add(self.current_idx)
         self.next_sprite()
 
     def next_sprite(self):
@@ -200,20 +229,24 @@ class SpriteSlicerGUI(tk.Tk):
             self.quit()
             return
 
-        saved_files = []
+        # Names of the PNG files written to outdir by this export
+        saved_files = set()
         outdir = None
-        if export_png or export_zip:
+        if export_png:
             outdir = filedialog.askdirectory(title="Choose output directory for PNGs")
             if not outdir:
                 messagebox.showinfo("Cancelled", "Save cancelled.")
                 self.quit()
                 return
-        if export_png:
+            jobs = []
             for action, idx in self.action_assignments.items():
-                if idx is not None and 0 <= idx < len(self.sliced_images):
+                if idx is not None and 0 <= idx < len(self.slice_boxes):
                     out_path = os.path.join(outdir, ACTION_TO_FILENAME[action])
-                    self.sliced_images[idx].save(out_path, format="PNG")
-                    saved_files.append(out_path)
+                    jobs.append((self.get_slice(idx), out_path))
+                    saved_files.add(ACTION_TO_FILENAME[action])
+            # PNG encoding releases the GIL, so the files are written in parallel
+            with ThreadPoolExecutor() as pool:
+                list(pool.map(lambda job: job[0].save(job[1], format="PNG"), jobs))
             msg = "Saved sprites for actions: " + ", ".join(
                 [a for a, idx in self.action_assignments.items() if idx is not None]
             )
@@ -228,43 +261,39 @@ class SpriteSlicerGUI(tk.Tk):
             if zip_path:
                 try:
                     with zipfile.ZipFile(zip_path, "w") as zipf:
-                        # If user only wants zip but not png, create temp files
+                        # If user only wants zip but not png, encode the
+                        # sprites in memory instead of going through temp files
+                        encoded = {}
                         if not export_png:
+                            names, sprites = [], []
                             for action, idx in self.action_assignments.items():
-                                if idx is not None and 0 <= idx < len(self.sliced_images):
-                                    tmp_path = os.path.join(outdir, ACTION_TO_FILENAME[action])
-                                    self.sliced_images[idx].save(tmp_path, format="PNG")
-                                    saved_files.append(tmp_path)
+                                if idx is not None and 0 <= idx < len(self.slice_boxes):
+                                    names.append(ACTION_TO_FILENAME[action])
+                                    sprites.append(self.get_slice(idx))
+                            with ThreadPoolExecutor() as pool:
+                                encoded = dict(zip(names, pool.map(png_bytes, sprites)))
                         # Ensure all 0.png to 11.png are present, fill missing with walk 1
-                        # 1. Map action assignments to output files
                         all_filenames = [f"{i}.png" for i in range(12)]
                         walk1_idx = self.action_assignments.get("walk 1")
-                        walk1_sprite = None
-                        if walk1_idx is not None and 0 <= walk1_idx < len(self.sliced_images):
-                            walk1_sprite = self.sliced_images[walk1_idx]
+                        walk1_png = None
+                        if walk1_idx is not None and 0 <= walk1_idx < len(self.slice_boxes):
+                            # Encoded once and reused for every missing slot
+                            walk1_png = png_bytes(self.get_slice(walk1_idx))
                         img_map = {ACTION_TO_FILENAME[a]: idx for a, idx in self.action_assignments.items() if idx is not None}
-                        # 2. Write/prepare all images
-                        temp_files_to_remove = []
                         for fname in all_filenames:
-                            fpath = os.path.join(outdir, fname)
-                            if fname not in img_map:
+                            if fname in encoded:
+                                zipf.writestr(fname, encoded[fname])
+                            elif fname in img_map:
+                                # Already exported as a PNG file above
+                                if fname in saved_files:
+                                    zipf.write(os.path.join(outdir, fname), fname)
+                            elif walk1_png is not None:
                                 # Not assigned, fill using walk 1
-                                if walk1_sprite is not None:
-                                    walk1_sprite.save(fpath, format="PNG")
-                                    temp_files_to_remove.append(fpath)
-                            # else, already saved in export_png or above
-                        # Now zip them all
-                        for fname in all_filenames:
-                            fpath = os.path.join(outdir, fname)
-                            if os.path.exists(fpath):
-                                zipf.write(fpath, fname)
-                        # Cleanup temp files if only zipped, not exported as png
-                        if not export_png:
-                            for f in temp_files_to_remove:
-                                try:
-                                    os.remove(f)
-                                except Exception:
-                                    pass
+                                if export_png:
+                                    with open(os.path.join(outdir, fname), "wb") as f:
+                                        f.write(walk1_png)
+                                    saved_files.add(fname)
+                                zipf.writestr(fname, walk1_png)
                     messagebox.showinfo("Exported", f"Sprites exported to zip: {zip_path}")
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to export zip: {e}")
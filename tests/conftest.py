@@ -0,0 +1,36 @@
+import os
+import sys
+import tkinter as tk
+
+import pytest
+
+# Make the backend package importable from every test module
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Decided once up front, so headless runs never attempt a display connection
+HAS_DISPLAY = bool(
+    os.environ.get("DISPLAY")
+    or os.environ.get("WAYLAND_DISPLAY")
+    or sys.platform.startswith("win")
+    or sys.platform == "darwin"
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    if HAS_DISPLAY:
+        return
+    skip_no_display = pytest.mark.skip(reason="Tkinter display not available")
+    for item in items:
+        if "tk_root" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip_no_display)
+
+
+@pytest.fixture(scope="session")
+def tk_root():
+    try:
+        root = tk.Tk()
+        root.withdraw()
+    except tk.TclError:
+        pytest.skip("Tkinter display not available")
+    yield root
+    root.destroy()
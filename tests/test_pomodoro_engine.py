@@ -1,9 +1,7 @@
-import os
-import sys
 import time
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from backend.pomodoro_engine import PomodoroEngine
+from backend.time_logger import TimeLogger
 
 
 def test_initial_state():
@@ -20,8 +18,10 @@ def test_time_format():
     assert engine.format_time(65) == "01:05"
 
 
-def test_reset_stops_logging():
+def test_reset_stops_logging(tmp_path):
     engine = PomodoroEngine(work_duration=3)
+    # Log into a temporary file instead of the real data/work_sessions.json
+    engine.time_logger = TimeLogger(log_file=str(tmp_path / "sessions.json"))
     engine.start()
     time.sleep(0.1)
     engine.reset()
@@ -1,8 +1,7 @@
-import os
-import sys
 import time
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+import pytest
+
 from backend.time_logger import TimeLogger
 
 
@@ -26,3 +25,16 @@ def test_data_persistence(tmp_path):
     logger2 = TimeLogger(log_file=str(log_file))
     sessions = logger2.get_all_sessions()
     assert len(sessions) == 1
+
+
+def test_failed_save_keeps_existing_log(tmp_path):
+    log_file = tmp_path / "keep.json"
+    logger = TimeLogger(log_file=str(log_file))
+    logger.start_work_session("A")
+    logger.stop_work_session(completed=True)
+    saved = log_file.read_bytes()
+
+    logger.sessions.append({"vpet_name": object()})
+    with pytest.raises(TypeError):
+        logger._save_sessions()
+    assert log_file.read_bytes() == saved
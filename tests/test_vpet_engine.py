@@ -1,27 +1,57 @@
-import os
-import sys
-import tkinter as tk
+import random
+import time
 
 import pytest
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from backend.vpet_engine import VPetEngine
 from backend.pet_events import PetEvent
 
 
-def test_engine_initialization():
-    try:
-        root = tk.Tk()
-        root.withdraw()
-    except tk.TclError:
-        pytest.skip("Tkinter display not available")
-    engine = VPetEngine(root_window=root)
-    assert engine.root_window is root
-    root.destroy()
+class DummyEvent(PetEvent):
+    def __init__(self, name: str, probability: float = 0.0):
+        super().__init__(
+            name=name, frames=[0], modes=["work"], probability=probability
+        )
+
+
+def mute_default_events(engine):
+    """Replace the built-in events with ones that never trigger on their own."""
+    for name in ("attack", "happy"):
+        engine.register_event(DummyEvent(name))
+
 
+def scheduled_ticks(engine, name):
+    return [tick for tick, _, entry in engine._event_schedule if entry == name]
 
-def test_attack_launches_projectile():
+
+@pytest.fixture
+def engine():
+    # Construction is cheap, so every test gets an engine of its own
     engine = VPetEngine()
+    engine.set_canvas_size(230, 60)
+    return engine
+
+
+def test_engine_initialization(tk_root):
+    engine = VPetEngine(root_window=tk_root)
+    assert engine.root_window is tk_root
+
+
+def test_dispatch_render_update_delivers_latest_state_once(engine):
+    received = []
+    engine.set_callbacks(on_position_update=lambda *state: received.append(state))
+    older = (10, 6, 0, "left", ())
+    latest = (13, 6, 1, "left", ())
+    # The animation thread publishes twice before the GUI polls
+    engine._render_mailbox.append(older)
+    engine._render_mailbox.append(latest)
+
+    assert engine.dispatch_render_update() is True
+    assert engine.dispatch_render_update() is False
+    assert received == [latest]
+
+
+def test_attack_launches_projectile(engine):
     # Ensure canvas small so projectile exits quickly
     engine.set_canvas_size(80, 60)
     attack_event = engine.events["attack"]
@@ -33,26 +63,21 @@ def test_attack_launches_projectile():
         attack_event.update(engine)
     assert len(engine.projectiles) == 1
     # Projectile should spawn from mid-body height
-    assert engine.projectiles[0]["y"] == engine.canvas_height - engine.sprite_height // 2
+    assert engine.projectiles[0].y == engine.canvas_height - engine.sprite_height // 2
     # Update projectiles until they vanish
-    for _ in range(10):
+    updates = 0
+    while engine.projectiles and updates < 10:
         engine._update_projectiles()
+        updates += 1
     assert len(engine.projectiles) == 0
 
 
-def test_queue_event_starts_immediately():
-    engine = VPetEngine()
+def test_queue_event_starts_immediately(engine):
     engine.queue_event("happy")
     assert engine.active_event is engine.events["happy"]
 
 
-def test_queue_event_runs_after_current():
-    engine = VPetEngine()
-
-    class DummyEvent(PetEvent):
-        def __init__(self, name: str):
-            super().__init__(name=name, frames=[0], modes=["work"], probability=0.0)
-
+def test_queue_event_runs_after_current(engine):
     first = DummyEvent("first")
     second = DummyEvent("second")
     engine.register_event(first)
@@ -62,16 +87,81 @@ def test_queue_event_runs_after_current():
     engine.queue_event("second")
 
     assert engine.active_event is first
-    assert engine.event_queue == ["second"]
+    assert list(engine.event_queue) == ["second"]
 
     frame, finished = engine.active_event.update(engine)
     assert finished
-    next_event = engine.active_event.complete(engine)
-    engine.active_event = None
-    if next_event:
-        engine._activate_event(next_event)
-    elif engine.event_queue:
-        engine._activate_event(engine.event_queue.pop(0))
+    engine.advance_to_next_event()
 
     assert engine.active_event is second
+    assert list(engine.event_queue) == []
 
+
+def test_scheduled_event_triggers_when_due(engine):
+    mute_default_events(engine)
+    always = DummyEvent("always", probability=1.0)
+    engine.register_event(always)
+
+    engine._walk_tick += 1
+    engine._trigger_due_event()
+    assert engine.active_event is always
+
+
+def test_ineligible_due_event_is_rescheduled(engine):
+    mute_default_events(engine)
+    engine.register_event(DummyEvent("always", probability=1.0))
+    # DummyEvent only runs in work mode
+    engine.set_mode("break")
+
+    engine._walk_tick += 1
+    engine._trigger_due_event()
+    assert engine.active_event is None
+    assert scheduled_ticks(engine, "always") == [engine._walk_tick + 1]
+
+
+def test_register_event_replaces_schedule_entry(engine):
+    mute_default_events(engine)
+    engine.register_event(DummyEvent("swap", probability=1.0))
+    assert scheduled_ticks(engine, "swap") == [engine._walk_tick + 1]
+
+    engine.register_event(DummyEvent("swap", probability=0.5))
+    assert len(scheduled_ticks(engine, "swap")) == 1
+
+    # An event that never triggers on its own leaves no entry behind
+    engine.register_event(DummyEvent("swap", probability=0.0))
+    assert scheduled_ticks(engine, "swap") == []
+
+
+def test_event_fires_at_sampled_tick():
+    engine = VPetEngine(rng=random.Random(1234))
+    mute_default_events(engine)
+    rare = DummyEvent("rare", probability=0.2)
+    # Replay the engine's generator to learn the delay it is about to draw
+    probe = random.Random()
+    probe.setstate(engine.rng.getstate())
+    delay = rare.ticks_until_trigger(probe)
+    engine.register_event(rare)
+
+    for _ in range(delay - 1):
+        engine._walk_tick += 1
+        engine._trigger_due_event()
+        assert engine.active_event is None
+    engine._walk_tick += 1
+    engine._trigger_due_event()
+    assert engine.active_event is rare
+
+
+def test_restart_keeps_animation_thread_running():
+    engine = VPetEngine()
+    engine.start_animation()
+    engine.stop_animation()
+    # The old thread is still alive here, so it has to keep serving
+    engine.start_animation()
+    try:
+        time.sleep(0.5)
+        assert engine.animation_running
+        assert engine.animation_thread.is_alive()
+    finally:
+        engine.stop_animation()
+        engine.animation_thread.join(timeout=2)
+    assert not engine.animation_thread.is_alive()